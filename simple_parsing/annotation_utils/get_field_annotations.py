@@ -3,11 +3,12 @@ import inspect
 import sys
 import types
 import typing
+import weakref
 from contextlib import contextmanager
 from dataclasses import InitVar
 from itertools import dropwhile
 from logging import getLogger as get_logger
-from typing import Any, Dict, Iterator, Optional, get_type_hints
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, get_type_hints
 
 logger = get_logger(__name__)
 
@@ -155,6 +156,10 @@ def _replace_new_union_syntax_with_old_union_syntax(
     return new_annotations
 
 
+# Cache of the evaluated field types, for each class.
+_field_types_cache: "weakref.WeakKeyDictionary[type, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
 def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
     """Get the annotation for the given field, in the 'old-style' format with types from
     typing.List, typing.Union, etc.
@@ -165,8 +170,46 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
 
     NOTE: If you get errors of this kind from the function below, then you might want to add an
     entry to the `forward_refs_to_types` dict above.
+
+    NOTE: The results are cached for each class, since evaluating the annotations is expensive.
+    Annotations that couldn't be evaluated (and are returned as strings) aren't cached, since
+    evaluating them depends on the frames of the caller, so they might work on a later call.
+    """
+    return get_field_types_from_annotations(some_class, [field_name])[field_name]
+
+
+def get_field_types_from_annotations(
+    some_class: type, field_names: Iterable[str]
+) -> Dict[str, type]:
+    """Same as `get_field_type_from_annotations`, but for multiple fields of the same class.
+
+    The namespaces and the type hints of the class are only computed once for all the fields,
+    rather than once per field.
     """
+    field_types: Dict[str, type] = {}
+    cached_field_types = _field_types_cache.get(some_class, {})
+    field_names_to_evaluate = []
+    for field_name in field_names:
+        if field_name in cached_field_types:
+            field_types[field_name] = cached_field_types[field_name]
+        else:
+            field_names_to_evaluate.append(field_name)
+    if not field_names_to_evaluate:
+        return field_types
+
+    new_field_types = _get_field_types_from_annotations(some_class, field_names_to_evaluate)
+    field_types.update(new_field_types)
+    evaluated_field_types = {k: v for k, v in new_field_types.items() if not isinstance(v, str)}
+    if evaluated_field_types:
+        try:
+            _field_types_cache.setdefault(some_class, {}).update(evaluated_field_types)
+        except TypeError:
+            # The class can't be weakly referenced.
+            pass
+    return field_types
 
+
+def _get_field_types_from_annotations(some_class: type, field_names: List[str]) -> Dict[str, type]:
     # Pretty hacky: Modify the type annotations of the class (preferably a copy of the class
     # if possible, to avoid modifying things in-place), and replace  the `a | b`-type
     # expressions with `Union[a, b]`, so that `get_type_hints` doesn't raise an error.
@@ -189,13 +232,35 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
     if frame is not None:
         local_ns.update(frame.f_locals)
 
+    # NOTE: The global namespace (and therefore the type hints of the class) only depends on which
+    # class in the MRO has the last definition of the field, so it is shared between the fields.
+    namespaces_and_annotations: Dict[
+        Tuple[type, ...], Tuple[Dict[str, Any], Mapping[str, Any]]
+    ] = {}
+    field_types: Dict[str, type] = {}
+    for field_name in field_names:
+        classes_to_iterate = tuple(
+            dropwhile(
+                lambda cls: field_name not in getattr(cls, "__annotations__", {}),
+                some_class.mro(),
+            )
+        )
+        if classes_to_iterate not in namespaces_and_annotations:
+            namespaces_and_annotations[classes_to_iterate] = _get_global_ns_and_annotations(
+                some_class, classes_to_iterate, local_ns
+            )
+        global_ns, annotations_dict = namespaces_and_annotations[classes_to_iterate]
+        field_types[field_name] = _evaluate_field_type(
+            some_class, field_name, annotations_dict, global_ns, local_ns
+        )
+    return field_types
+
+
+def _get_global_ns_and_annotations(
+    some_class: type, classes_to_iterate: Tuple[type, ...], local_ns: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Mapping[str, Any]]:
     # Get the global_ns in the module starting from the deepest base until the module with the field_name last definition.
     global_ns = {}
-    classes_to_iterate = list(
-        dropwhile(
-            lambda cls: field_name not in getattr(cls, "__annotations__", {}), some_class.mro()
-        )
-    )
     for base_cls in reversed(classes_to_iterate):
         global_ns.update(sys.modules[base_cls.__module__].__dict__)
 
@@ -206,7 +271,16 @@ def get_field_type_from_annotations(some_class: type, field_name: str) -> type:
         annotations_dict = collections.ChainMap(
             *[getattr(cls, "__annotations__", {}) for cls in some_class.mro()]
         )
+    return global_ns, annotations_dict
+
 
+def _evaluate_field_type(
+    some_class: type,
+    field_name: str,
+    annotations_dict: Mapping[str, Any],
+    global_ns: Dict[str, Any],
+    local_ns: Dict[str, Any],
+) -> type:
     if field_name not in annotations_dict:
         raise ValueError(f"Field {field_name} not found in annotations of class {some_class}")
 
@@ -79,6 +79,9 @@ class ConflictResolver:
         assert len(dests) == len(set(dests)), f"shouldn't be any duplicates: {wrappers_flat}"
 
         conflict = self.get_conflict(wrappers_flat)
+        if conflict is None:
+            # Nothing to resolve (the most common case, e.g. with a single dataclass).
+            return wrappers_flat
 
         # current and maximum number of attempts. When reached, raises an error.
         cur_attempts = 0
@@ -261,7 +264,9 @@ class ConflictResolver:
         field_wrappers = sorted(conflict.wrappers, key=lambda w: w.nesting_level)
         logger.debug(f"Conflict with options string '{conflict.option_string}':")
         for i, field in enumerate(field_wrappers):
-            logger.debug(f"Field wrapper #{i+1}: {field} nesting level: {field.nesting_level}.")
+            logger.debug(
+                "Field wrapper #%s: %s nesting level: %s.", i + 1, field, field.nesting_level
+            )
 
         assert (
             len(set(field_wrappers)) >= 2
@@ -330,7 +335,7 @@ class ConflictResolver:
         fields = sorted(conflict.wrappers, key=lambda w: w.nesting_level)
         logger.debug(f"Conflict with options string '{conflict.option_string}':")
         for field in fields:
-            logger.debug(f"Field wrapper: {field} nesting level: {field.nesting_level}.")
+            logger.debug("Field wrapper: %s nesting level: %s.", field, field.nesting_level)
 
         assert len(conflict.wrappers) > 1
 
@@ -1,5 +1,5 @@
 from .hparam import categorical, hparam, log_uniform, loguniform, uniform
-from .hyperparameters import HP, HyperParameters, Point
+from .hyperparameters import HP, HyperParameters, Point, perf_key, point_equal
 from .priors import LogUniformPrior, UniformPrior
 
 __all__ = [
@@ -11,6 +11,8 @@ __all__ = [
     "HP",
     "HyperParameters",
     "Point",
+    "perf_key",
+    "point_equal",
     "LogUniformPrior",
     "UniformPrior",
 ]
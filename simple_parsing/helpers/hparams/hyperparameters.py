@@ -1,35 +1,40 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import inspect
 import math
+import operator
 import pickle
 import random
 import typing
-from collections import OrderedDict
 from dataclasses import Field, dataclass, fields
-from functools import singledispatch, total_ordering
+from functools import singledispatch
 from logging import getLogger
 from pathlib import Path
-from typing import Any, ClassVar, NamedTuple, TypeVar
+from typing import Any, Callable, ClassVar, NamedTuple, Sequence, TypeVar
 
 from simple_parsing import utils
+from simple_parsing.annotation_utils.get_field_annotations import (
+    get_field_types_from_annotations,
+)
+from simple_parsing.helpers.serialization.decoding import decode_field
 from simple_parsing.helpers.serialization.serializable import Serializable
 from simple_parsing.utils import (
     compute_identity,
     dict_union,
-    field_dict,
     get_type_arguments,
 )
 
 from .hparam import ValueOutsidePriorException
-from .priors import Prior
+from .priors import Prior, numpy_installed
 
 if typing.TYPE_CHECKING:
     import numpy
 
 logger = getLogger(__name__)
 T = TypeVar("T")
+V = TypeVar("V")
 HP = TypeVar("HP", bound="HyperParameters")
 
 
@@ -43,6 +48,57 @@ class BoundInfo(Serializable):
     domain: tuple[float, float] = (-math.inf, math.inf)
 
 
+def _cached_on_class(fn: Callable[[type[T]], V]) -> Callable[[type[T]], V]:
+    """Caches the result of the classmethod `fn` in the `__dict__` of the class it is called on.
+
+    The result is stored separately for each subclass. Each call returns a copy of the cached
+    value (see `_copy_cached_value`), so the caller can modify it without changing the cache.
+    """
+    attribute = f"_{fn.__name__}_result"
+
+    @functools.wraps(fn)
+    def _wrapper(cls: type[T]) -> V:
+        if attribute not in cls.__dict__:
+            setattr(cls, attribute, fn(cls))
+        return _copy_cached_value(cls.__dict__[attribute])
+
+    return _wrapper
+
+
+def _copy_cached_value(value: V) -> V:
+    """Copies the dicts, lists, tuples and `BoundInfo` objects in `value`, recursively.
+
+    Other values (e.g. strings or priors) are returned as-is.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_cached_value(v) for k, v in value.items()}  # type: ignore
+    if isinstance(value, list):
+        return [_copy_cached_value(v) for v in value]  # type: ignore
+    if isinstance(value, tuple):
+        return tuple(_copy_cached_value(v) for v in value)  # type: ignore
+    if isinstance(value, BoundInfo):
+        return dataclasses.replace(value)  # type: ignore
+    return value
+
+
+# Types of values that can't be modified in-place. The result of `HyperParameters.id` is only
+# cached when the values of all the fields have one of these types.
+_IMMUTABLE_TYPES = (str, int, float, bool, complex, bytes, type(None))
+
+
+class _FieldInfo(NamedTuple):
+    """The attributes of a field of a `HyperParameters` class that are used when sampling."""
+
+    name: str
+    type: Any
+    prior: Prior | None
+    postprocessing: Callable[[Any], Any] | None
+    min: float | None
+    max: float | None
+    # Whether the type of the field is a subclass of HyperParameters.
+    is_nested: bool
+
+
 @dataclass
 class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignore
     """Base class for dataclasses of HyperParameters."""
@@ -52,29 +108,112 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
 
     rng: ClassVar[random.Random] = random.Random()
 
+    # Per-class caches of the dataclass fields (and of their metadata), so we don't need to
+    # introspect the dataclass at every call to `sample`, `get_priors`, etc.
+    # NOTE: These are populated lazily by `_populate_caches`, since `__init_subclass__` gets
+    # called *before* the `@dataclass` decorator is applied to the subclass.
+    _hp_fields: ClassVar[tuple[Field, ...]]
+    _hp_field_metadata: ClassVar[tuple[_FieldInfo, ...]]
+    _field_names: ClassVar[tuple[str, ...]]
+    # The (name, function) pairs of the fields that have a postprocessing function.
+    _postprocessing: ClassVar[tuple[tuple[str, Callable[[Any], Any]], ...]]
+    # The fields that are arguments of `__init__`, and the (evaluated) type of each field.
+    _init_fields: ClassVar[dict[str, Field]]
+    _field_types: ClassVar[dict[str, Any]]
+    # Names of the fields with an `int`, `float` or `bool` annotation, used in `to_array` and
+    # `from_array`.
+    _numeric_field_names: ClassVar[tuple[str, ...]]
+    _numeric_field_priors: ClassVar[tuple[Prior | None, ...]]
+    # Names and bounds of the fields that get clipped in `clip_within_bounds`.
+    # NOTE: The bounds are numpy arrays when numpy is installed. (`numpy` isn't used in these
+    # annotations, so that `get_type_hints` works on subclasses without numpy in their namespace.)
+    _clip_names: ClassVar[tuple[str, ...]]
+    _clip_discrete: ClassVar[tuple[bool, ...]]
+    _clip_lo: ClassVar[Sequence[float]]
+    _clip_hi: ClassVar[Sequence[float]]
+    # Function generated by `_create_sample_fn`, used in `sample`.
+    _sample_impl: ClassVar[Callable[[type[HP]], HP]]
+
+    @classmethod
+    def _populate_caches(cls) -> None:
+        if "_hp_fields" in cls.__dict__:
+            return
+        hp_fields = fields(cls)
+        # The type of a field is a string when using `from __future__ import annotations`.
+        field_types = get_field_types_from_annotations(
+            cls, [f.name for f in hp_fields if isinstance(f.type, str)]
+        )
+        field_metadata: list[_FieldInfo] = []
+        for f in hp_fields:
+            field_type = field_types.get(f.name, f.type)
+            field_metadata.append(
+                _FieldInfo(
+                    name=f.name,
+                    type=field_type,
+                    prior=f.metadata.get("prior"),
+                    postprocessing=f.metadata.get("postprocessing"),
+                    min=f.metadata.get("min"),
+                    max=f.metadata.get("max"),
+                    is_nested=inspect.isclass(field_type)
+                    and issubclass(field_type, HyperParameters),
+                )
+            )
+        cls._hp_field_metadata = tuple(field_metadata)
+        cls._field_names = tuple(f.name for f in hp_fields)
+        cls._postprocessing = tuple(
+            (f.name, f.postprocessing)
+            for f in cls._hp_field_metadata
+            if f.postprocessing is not None
+        )
+        cls._init_fields = {f.name: f for f in hp_fields if f.init}
+        cls._field_types = {f.name: f.type for f in cls._hp_field_metadata}
+        numeric_fields = tuple(f for f in cls._hp_field_metadata if f.type in (int, float, bool))
+        cls._numeric_field_names = tuple(f.name for f in numeric_fields)
+        cls._numeric_field_priors = tuple(f.prior for f in numeric_fields)
+        cls._sample_impl = staticmethod(_create_sample_fn(cls))
+        cls._hp_fields = hp_fields
+
     def __post_init__(self):
-        for name, f in field_dict(self).items():
-            f: Field
-            assert name == f.name
+        cls = type(self)
+        cls._populate_caches()
+        # Apply the post-processing functions, if any.
+        for name, postprocessing in cls._postprocessing:
             value = getattr(self, name)
-            # Apply any post-processing function, if applicable.
-            if "postprocessing" in f.metadata:
-                logger.debug(f"Post-processing of field {name}")
-                try:
-                    new_value = f.metadata["postprocessing"](value)
-                except ValueOutsidePriorException as e:
-                    raise ValueError(
-                        f"Field '{name}' got value {repr(e.value)}, which is outside of the "
-                        f"defined prior region: {e.prior}."
-                    )
-                setattr(self, name, new_value)
+            logger.debug(f"Post-processing of field {name}")
+            try:
+                new_value = postprocessing(value)
+            except ValueOutsidePriorException as e:
+                raise ValueError(
+                    f"Field '{name}' got value {repr(e.value)}, which is outside of the "
+                    f"defined prior region: {e.prior}."
+                )
+            setattr(self, name, new_value)
 
     @classmethod
-    def field_names(cls) -> list[str]:
-        return [f.name for f in fields(cls)]
+    def field_names(cls) -> tuple[str, ...]:
+        cls._populate_caches()
+        return cls._field_names
 
-    def id(self):
-        return compute_identity(**self.to_dict())
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Invalidate the cached result of `id()`.
+        self.__dict__.pop("_cached_id", None)
+
+    def id(self) -> str:
+        """Returns a hash of the values of the fields.
+
+        The result is cached on the instance, and is invalidated when a field is set. It is only
+        cached when the values of all the fields are immutable (e.g. numbers or strings), since
+        lists, dicts or nested HyperParameters can be modified in-place without setting a field.
+        """
+        cached_id = self.__dict__.get("_cached_id")
+        if cached_id is None:
+            cached_id = compute_identity(**self.to_dict())
+            cls = type(self)
+            cls._populate_caches()
+            if all(type(getattr(self, name)) in _IMMUTABLE_TYPES for name in cls._field_names):
+                object.__setattr__(self, "_cached_id", cached_id)
+        return cached_id
 
     def seed(self, seed: int | None) -> None:
         """TODO: Seed all priors with the given seed. (recursively if nested dataclasses
@@ -83,32 +222,32 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
         raise NotImplementedError("TODO")
 
     @classmethod
+    @_cached_on_class
     def get_priors(cls) -> dict[str, Prior]:
         """Returns a dictionary of the Priors for the hparam fields in this class."""
+        cls._populate_caches()
         priors_dict: dict[str, Prior] = {}
-        for field in fields(cls):
+        for field in cls._hp_field_metadata:
             # If a HyperParameters class contains another HyperParameters class as a field
             # we perform returned a flattened dict.
-            if inspect.isclass(field.type) and issubclass(field.type, HyperParameters):
+            if field.is_nested:
                 priors_dict[field.name] = field.type.get_priors()
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior:
-                    priors_dict[field.name] = prior
+            elif field.prior:
+                priors_dict[field.name] = field.prior
         return priors_dict
 
     @classmethod
+    @_cached_on_class
     def get_orion_space_dict(cls) -> dict[str, str]:
+        cls._populate_caches()
         result: dict[str, str] = {}
-        for field in fields(cls):
+        for field in cls._hp_field_metadata:
             # If a HyperParameters class contains another HyperParameters class as a field
             # we perform returned a flattened dict.
-            if inspect.isclass(field.type) and issubclass(field.type, HyperParameters):
+            if field.is_nested:
                 result[field.name] = field.type.get_orion_space_dict()
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior:
-                    result[field.name] = prior.get_orion_space_string()
+            elif field.prior:
+                result[field.name] = field.prior.get_orion_space_string()
         return result
 
     def get_orion_space(self) -> dict[str, str]:
@@ -116,34 +255,37 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
         version, for example when a field is a different kind of dataclass than its
         annotation.
         """
+        cls = type(self)
+        cls._populate_caches()
         result: dict[str, str] = {}
-        for field in fields(self):
+        for field in cls._hp_field_metadata:
             value = getattr(self, field.name)
             # If a HyperParameters class contains another HyperParameters class as a field
             # we perform returned a flattened dict.
             if isinstance(value, HyperParameters):
                 result[field.name] = value.get_orion_space()
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior:
-                    result[field.name] = prior.get_orion_space_string()
+            elif field.prior:
+                result[field.name] = field.prior.get_orion_space_string()
         return result
 
     @classmethod
+    @_cached_on_class
     def space_id(cls):
         return compute_identity(**cls.get_orion_space_dict())
 
     @classmethod
-    def get_bounds(cls) -> list[BoundInfo]:
+    @_cached_on_class
+    def get_bounds(cls) -> tuple[BoundInfo, ...]:
         """Returns the bounds of the search domain for this type of HParam.
 
-        Returns them as a list of `BoundInfo` objects, in the format expected by GPyOpt.
+        Returns them as a tuple of `BoundInfo` objects, in the format expected by GPyOpt.
         """
+        cls._populate_caches()
         bounds: list[BoundInfo] = []
-        for f in fields(cls):
+        for f in cls._hp_field_metadata:
             # TODO: handle a hparam which is categorical (i.e. choices)
-            min_v = f.metadata.get("min")
-            max_v = f.metadata.get("max")
+            min_v = f.min
+            max_v = f.max
             if min_v is None or max_v is None:
                 continue
             if f.type is float:
@@ -153,47 +295,66 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
             else:
                 raise NotImplementedError(f"Unsupported type for field {f.name}: {f.type}")
             bounds.append(bound)
-        return bounds
+        return tuple(bounds)
 
     @classmethod
+    @_cached_on_class
     def get_bounds_dicts(cls) -> list[dict[str, Any]]:
         """Returns the bounds of the search space for this type of HParam, in the format expected
         by the `GPyOpt` package."""
-        return [b.to_dict() for b in cls.get_bounds()]
+        # NOTE: Equivalent to `[b.to_dict() for b in cls.get_bounds()]`, without going through
+        # the (generic) serialization of `Serializable.to_dict`.
+        return [
+            {"name": b.name, "type": b.type, "domain": list(b.domain)} for b in cls.get_bounds()
+        ]
 
     @classmethod
-    def sample(cls):
-        kwargs: dict[str, Any] = {}
-        for field in dataclasses.fields(cls):
-            if inspect.isclass(field.type) and issubclass(field.type, HyperParameters):
-                # TODO: Should we allow adding a 'prior' in terms of a dataclass field?
-                kwargs[field.name] = field.type.sample()
-
-            elif utils.is_union(field.type) and all(
-                inspect.isclass(v) and issubclass(v, HyperParameters)
-                for v in utils.get_type_arguments(field.type)
-            ):
-                chosen_class = random.choice(get_type_arguments(field.type))
-                # BUG: Seems to be a bit of a bug here, when the numpy rng is set!
-                value = chosen_class.sample()
-                kwargs[field.name] = value
-            else:
-                prior: Prior | None = field.metadata.get("prior")
-                if prior is not None:
-                    try:
-                        import numpy as np
-
-                        prior.np_rng = np.random
-                    except ImportError:
-                        prior.rng = cls.rng
-                    value = prior.sample()
-                    shape = getattr(prior, "shape", None)
-                    if shape == () and hasattr(value, "item") and callable(value.item):
-                        value = value.item()
-                    kwargs[field.name] = value
-        return cls(**kwargs)
+    def sample(cls: type[HP]) -> HP:
+        cls._populate_caches()
+        return cls._sample_impl(cls)
+
+    @classmethod
+    def sample_many(cls, n: int, dtype: numpy.dtype | None = None) -> numpy.ndarray:
+        """Samples `n` points at once, as an array of shape `(n, K)`.
+
+        The columns are the `K` fields with an `int`, `float` or `bool` annotation, in the same
+        order as in `to_array`, so each row can be passed to `from_array`. Each prior draws all of
+        its `n` values in a single call.
+        """
+        import numpy as np
+
+        dtype = np.float32 if dtype is None else dtype
+        cls._populate_caches()
+        priors = cls._numeric_field_priors
+        if any(prior is None for prior in priors):
+            raise RuntimeError(
+                f"All the int, float or bool fields of {cls} need to have a prior in order to use "
+                f"`sample_many`."
+            )
+        samples = np.empty((n, len(priors)), dtype=dtype)
+        for i, prior in enumerate(priors):
+            samples[:, i] = prior.sample_many(n)
+        return samples
 
     def replace(self, **new_params):
+        cls = type(self)
+        cls._populate_caches()
+        init_fields = cls._init_fields
+        if all(
+            name in init_fields and not isinstance(value, dict)
+            for name, value in new_params.items()
+        ):
+            # Fast path: No need to go through `to_dict` and `from_dict` when there aren't any
+            # changes to the fields of nested dataclasses. Values that don't already have the type
+            # of their field are still decoded like in `from_dict` (e.g. "0.1" -> 0.1).
+            field_types = cls._field_types
+            changes = {
+                name: value
+                if _has_type(value, field_types[name])
+                else decode_field(init_fields[name], value, containing_dataclass=cls)
+                for name, value in new_params.items()
+            }
+            return dataclasses.replace(self, **changes)
         new_hp_dict = dict_union(self.to_dict(), new_params, recurse=True)
         new_hp = type(self).from_dict(new_hp_dict)
         return new_hp
@@ -210,41 +371,134 @@ class HyperParameters(Serializable, decode_into_subclasses=True):  # type: ignor
         import numpy as np
 
         dtype = np.float32 if dtype is None else dtype
-        values: list[float] = []
-        for k, v in self.to_dict(dict_factory=OrderedDict).items():
-            try:
-                v = float(v)
-            except Exception:
-                logger.warning(f"Ignoring field {k} because we can't make a float out of it.")
-            else:
-                values.append(v)
-        return np.array(values, dtype=dtype)
+        cls = type(self)
+        cls._populate_caches()
+        return np.fromiter(
+            (getattr(self, name) for name in cls._numeric_field_names),
+            dtype=dtype,
+            count=len(cls._numeric_field_names),
+        )
 
     @classmethod
     def from_array(cls: type[HP], array: numpy.ndarray) -> HP:
-        import numpy as np
-
         if len(array.shape) == 2 and array.shape[0] == 1:
             array = array[0]
 
-        keys = list(field_dict(cls))
+        cls._populate_caches()
+        keys = cls._numeric_field_names
         # idea: could use to_dict and to_array together to determine how many
         # values to get for each field. For now we assume that each field is one
         # variable.
-        # cls.sample().to_dict()
-        # assert len(keys) == len(array), "assuming that each field is dim 1 for now."
         assert len(keys) == len(array), "assuming that each field is dim 1 for now."
-        d = OrderedDict(zip(keys, array))
+        # NOTE: `tolist` gives back python scalars rather than numpy values.
+        d = dict(zip(keys, array.tolist()))
         logger.debug(f"Creating an instance of {cls} using args {d}")
-        d = OrderedDict((k, v.item() if isinstance(v, np.ndarray) else v) for k, v in d.items())
         return cls.from_dict(d)
 
     def clip_within_bounds(self: HP) -> HP:
-        d = self.to_dict()
-        for bound in self.get_bounds():
-            min_v, max_v = bound.domain
-            d[bound.name] = min(max_v, max(min_v, d[bound.name]))
-        return self.from_dict(d)
+        cls = type(self)
+        if "_clip_names" not in cls.__dict__:
+            # NOTE: Not done in `_populate_caches`, since `get_bounds` raises an error for some
+            # types of fields.
+            bounds = cls.get_bounds()
+            cls._clip_names = tuple(b.name for b in bounds)
+            cls._clip_discrete = tuple(b.type == "discrete" for b in bounds)
+            cls._clip_lo = tuple(b.domain[0] for b in bounds)
+            cls._clip_hi = tuple(b.domain[1] for b in bounds)
+            if numpy_installed:
+                import numpy as np
+
+                cls._clip_lo = np.array(cls._clip_lo, dtype=np.float64)
+                cls._clip_hi = np.array(cls._clip_hi, dtype=np.float64)
+
+        values = [getattr(self, name) for name in cls._clip_names]
+        if numpy_installed:
+            import numpy as np
+
+            values_array = np.array(values, dtype=np.float64)
+            np.clip(values_array, cls._clip_lo, cls._clip_hi, out=values_array)
+            values = values_array.tolist()
+        else:
+            values = [
+                min(max_v, max(min_v, v))
+                for v, min_v, max_v in zip(values, cls._clip_lo, cls._clip_hi)
+            ]
+        changes = {
+            name: round(value) if discrete else value
+            for name, value, discrete in zip(cls._clip_names, values, cls._clip_discrete)
+        }
+        return dataclasses.replace(self, **changes)
+
+
+def _create_sample_fn(cls: type[HP]) -> Callable[[type[HP]], HP]:
+    """Generates the source code of a function that samples an instance of `cls`.
+
+    The priors and the types of nested HyperParameters are bound as default arguments of the
+    generated function, so that sampling doesn't involve any introspection of the fields, e.g.:
+
+    ```
+    def _sample(cls, _rng=_rng, _p0=_p0, _t1=_t1):
+        _p0.np_rng = _rng
+        return cls(learning_rate=_p0.sample(), child=_t1.sample())
+    ```
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    namespace: dict[str, Any] = {"_rng": np.random if np is not None else None}
+    body: list[str] = []
+    kwargs: list[str] = []
+    for i, field in enumerate(cls._hp_field_metadata):
+        if field.is_nested:
+            # TODO: Should we allow adding a 'prior' in terms of a dataclass field?
+            namespace[f"_t{i}"] = field.type
+            kwargs.append(f"{field.name}=_t{i}.sample()")
+
+        elif utils.is_union(field.type) and all(
+            inspect.isclass(v) and issubclass(v, HyperParameters)
+            for v in utils.get_type_arguments(field.type)
+        ):
+            # BUG: Seems to be a bit of a bug here, when the numpy rng is set!
+            namespace["_random_choice"] = random.choice
+            namespace[f"_u{i}"] = tuple(get_type_arguments(field.type))
+            kwargs.append(f"{field.name}=_random_choice(_u{i}).sample()")
+
+        elif field.prior is not None:
+            namespace[f"_p{i}"] = field.prior
+            if np is not None:
+                body.append(f"_p{i}.np_rng = _rng")
+            else:
+                body.append(f"_p{i}.rng = cls.rng")
+            if getattr(field.prior, "shape", None) == ():
+                namespace["_item"] = _item
+                kwargs.append(f"{field.name}=_item(_p{i}.sample())")
+            else:
+                kwargs.append(f"{field.name}=_p{i}.sample()")
+
+    args = ", ".join(["cls"] + [f"{name}={name}" for name in namespace])
+    body.append(f"return cls({', '.join(kwargs)})")
+    source = f"def _sample({args}):\n" + "\n".join(f"    {line}" for line in body)
+    local_namespace: dict[str, Any] = {}
+    exec(source, namespace, local_namespace)
+    return local_namespace["_sample"]
+
+
+def _has_type(value: Any, field_type: Any) -> bool:
+    """Returns whether `value` is an instance of `field_type` (or of one of the types in a Union).
+
+    Returns False for other kinds of annotations, e.g. `list[int]`.
+    """
+    if utils.is_union(field_type):
+        return any(_has_type(value, t) for t in get_type_arguments(field_type))
+    return inspect.isclass(field_type) and isinstance(value, field_type)
+
+
+def _item(value: Any) -> Any:
+    if hasattr(value, "item") and callable(value.item):
+        return value.item()
+    return value
 
 
 @singledispatch
@@ -263,41 +517,78 @@ def save_serializable(obj: Serializable, path: Path) -> None:
     obj.save(path)
 
 
-@total_ordering
 class Point(NamedTuple):
+    """A (hyper-parameters, performance) pair.
+
+    Points are ordered by their performance only, so `sorted(points)` sorts them by `perf`. Passing
+    `key=perf_key` to `sorted`, `min` or `max` gives the same order without going through the
+    comparison methods below, which is faster for long lists of points.
+
+    Points are equal to other (hp, perf) pairs whose hyper-parameters are given as a dict, when
+    the values are the same (see `point_equal`).
+
+    NOTE: Comparing a Point with something other than a (hp, perf) pair returns `NotImplemented`,
+    rather than exiting the program.
+    """
+
     hp: HyperParameters
     perf: float
 
-    def __eq__(self, other: object):
-        if not isinstance(other, tuple):
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
             return NotImplemented
-        elif not len(other) == 2:
+        return point_equal(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
             return NotImplemented
-        # NOTE: This doesn't do any kind
-        other_hp, other_perf = other
-        hps_equal = self.hp == other_hp
-        if not hps_equal and isinstance(other_hp, dict):
-            other_id = compute_identity(**other_hp)
-            # this is hairy, but need to check if the dicts would be equal.
-            if isinstance(self.hp, dict):
-                # This should ideally never be the case, we would hope that
-                # people are using HyperParameter objects in the Point tuples.
-                hp_id = compute_identity(**self.hp)
-            else:
-                hp_id = self.hp.id()
-            hps_equal = hp_id == other_id
-        return hps_equal and self.perf == other[1]
-
-    def __gt__(self, other: tuple[object, ...]) -> bool:
-        # Even though the tuple has (hp, perf), compare based on the order
-        # (perf, hp).
-        # This means that sorting a list of Points will work as expected!
-        if isinstance(other, (Point, tuple)):
-            hp, perf = other
-            if not isinstance(perf, float):
-                print(other)
-                exit()
-        return self.perf > perf
-
-    # def __repr__(self):
-    #     return super().__repr__()
+        return not point_equal(self, other)
+
+    def __lt__(self, other: tuple[Any, float]) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
+            return NotImplemented
+        return self.perf < other[1]
+
+    def __le__(self, other: tuple[Any, float]) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
+            return NotImplemented
+        return self.perf <= other[1]
+
+    def __gt__(self, other: tuple[Any, float]) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
+            return NotImplemented
+        return self.perf > other[1]
+
+    def __ge__(self, other: tuple[Any, float]) -> bool:
+        if not isinstance(other, tuple) or len(other) != 2:
+            return NotImplemented
+        return self.perf >= other[1]
+
+
+perf_key: Callable[[tuple[Any, float]], float] = operator.itemgetter(1)
+"""Key function for sorting (hp, perf) points by performance, e.g. with `sorted` or `max`."""
+
+
+def point_equal(a: tuple[Any, float], b: tuple[Any, float]) -> bool:
+    """Returns whether two (hp, perf) points are equal.
+
+    The hyper-parameters of either point can be a `HyperParameters` object or a dict. Other kinds
+    of hyper-parameters are only compared with `==`.
+    """
+    if a is b:
+        return True
+    a_hp, a_perf = a
+    b_hp, b_perf = b
+    # Compare the performances first, since that is much cheaper than comparing the hparams.
+    if a_perf != b_perf:
+        return False
+    if a_hp == b_hp:
+        return True
+    if (isinstance(a_hp, dict) or isinstance(b_hp, dict)) and all(
+        isinstance(hp, (dict, HyperParameters)) for hp in (a_hp, b_hp)
+    ):
+        # this is hairy, but need to check if the dicts would be equal.
+        a_id = compute_identity(**a_hp) if isinstance(a_hp, dict) else a_hp.id()
+        b_id = compute_identity(**b_hp) if isinstance(b_hp, dict) else b_hp.id()
+        return a_id == b_id
+    return False
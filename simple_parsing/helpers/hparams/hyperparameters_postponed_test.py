@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from simple_parsing import mutable_field
+
+from .hparam import uniform
+from .hyperparameters import HyperParameters
+
+numpy_installed = False
+try:
+    import numpy as np
+
+    numpy_installed = True
+except ImportError:
+    pass
+
+
+@dataclass
+class Child(HyperParameters):
+    momentum: float = uniform(0.0, 1.0)
+
+
+@dataclass
+class Parent(HyperParameters):
+    learning_rate: float = uniform(0.0, 1.0)
+    n_layers: int = uniform(1, 10)
+    child: Child = mutable_field(Child, momentum=0.5)
+
+
+def test_nested_field_is_sampled():
+    parent = Parent.sample()
+    assert isinstance(parent.child, Child)
+    assert Parent.get_orion_space_dict() == {
+        "learning_rate": "uniform(0.0, 1.0)",
+        "n_layers": "uniform(1, 10, discrete=True)",
+        "child": {"momentum": "uniform(0.0, 1.0)"},
+    }
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_to_array_from_array():
+    parent = Parent.sample()
+    array = parent.to_array()
+    assert array.shape == (2,)
+    assert np.isclose(array[0], parent.learning_rate)
+    assert array[1] == parent.n_layers
+
+    from_array = Parent.from_array(array)
+    assert np.isclose(from_array.learning_rate, parent.learning_rate)
+    assert from_array.n_layers == parent.n_layers
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_many():
+    samples = Parent.sample_many(10)
+    assert samples.shape == (10, 2)
+    parent = Parent.from_array(samples[0])
+    assert isinstance(parent.child, Child)
@@ -3,8 +3,10 @@ from typing import Sequence, Union
 
 import pytest
 
+from simple_parsing import list_field, mutable_field
+
 from .hparam import categorical, log_uniform, uniform
-from .hyperparameters import HyperParameters
+from .hyperparameters import HyperParameters, Point, perf_key, point_equal
 
 numpy_installed = False
 try:
@@ -41,6 +43,39 @@ def test_from_array():
     assert b.momentum == 1.0
 
 
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_to_array_includes_bool_fields():
+    @dataclass
+    class D(HyperParameters):
+        lr: float = uniform(0.0, 1.0, default=0.5)
+        flag: bool = True
+        n: int = uniform(1, 10, default=2)
+
+    d = D()
+    array = d.to_array()
+    assert array.tolist() == [0.5, 1.0, 2.0]
+    assert D.from_array(array) == d
+
+
+@pytest.mark.skipif(not numpy_installed, reason="Test requires numpy.")
+def test_sample_many():
+    @dataclass
+    class D(HyperParameters):
+        lr: float = log_uniform(1e-6, 1e-1, default=1e-3)
+        n_layers: int = uniform(1, 10, default=2)
+        momentum: float = uniform(0.0, 1.0, default=0.9)
+
+    samples = D.sample_many(100, dtype=np.float64)
+    assert samples.shape == (100, 3)
+    assert ((1e-6 <= samples[:, 0]) & (samples[:, 0] <= 1e-1)).all()
+    assert ((1 <= samples[:, 1]) & (samples[:, 1] <= 10)).all()
+    assert (samples[:, 1] == np.round(samples[:, 1])).all()
+    assert ((0 <= samples[:, 2]) & (samples[:, 2] <= 1)).all()
+
+    d = D.from_array(samples[0])
+    assert d.to_array(dtype=np.float64).tolist() == samples[0].tolist()
+
+
 @dataclass
 class C(HyperParameters):
     lr: float = uniform(0.0, 1.0)
@@ -85,6 +120,54 @@ def test_clip_within_bounds():
     assert C(a=-1.234, b=1000, c="foo").clip_within_bounds() == C(123, 123.456, "foo")
 
 
+def test_get_bounds_dicts():
+    @dataclass
+    class C(HyperParameters):
+        a: int = uniform(123, 456, discrete=True)
+        b: float = log_uniform(4.56, 123.456)
+        c: str = categorical("foo", "bar", "baz")
+
+    assert C.get_bounds_dicts() == [b.to_dict() for b in C.get_bounds()]
+    assert C.get_bounds_dicts() == [
+        {"name": "a", "type": "discrete", "domain": [123, 456]},
+        {"name": "b", "type": "continuous", "domain": [4.56, 123.456]},
+    ]
+
+
+def test_modifying_class_results_doesnt_change_cache():
+    @dataclass
+    class Child(HyperParameters):
+        foo: int = uniform(0, 10, default=5)
+
+    @dataclass
+    class Parent(HyperParameters):
+        child: Child = mutable_field(Child)
+        lr: float = uniform(0.0, 1.0, default=0.1)
+
+    priors = Parent.get_priors()
+    priors["lr"] = None
+    priors["child"]["foo"] = None
+    assert Parent.get_priors()["lr"] is not None
+    assert Parent.get_priors()["child"]["foo"] is not None
+
+    expected_space = Parent.get_orion_space_dict()
+    space = Parent.get_orion_space_dict()
+    space["lr"] = "bob"
+    space["child"].clear()
+    assert Parent.get_orion_space_dict() == expected_space
+
+    bounds = Parent.get_bounds()
+    bounds[0].domain = (0, 1)
+    assert Parent.get_bounds()[0].domain == (0.0, 1.0)
+
+    bounds_dicts = Parent.get_bounds_dicts()
+    bounds_dicts[0]["domain"].append(123)
+    bounds_dicts.clear()
+    assert Parent.get_bounds_dicts() == [
+        {"name": "lr", "type": "continuous", "domain": [0.0, 1.0]}
+    ]
+
+
 def test_strict_bounds():
     """When creating a class and using a hparam field with `strict=True`, the values will be
     restricted to be within the given bounds."""
@@ -117,8 +200,6 @@ def test_nesting():
     class Child(HyperParameters):
         foo: int = uniform(0, 10, default=5)
 
-    from simple_parsing import mutable_field
-
     @dataclass
     class Parent(HyperParameters):
         child_a: Child = mutable_field(Child, foo=3)
@@ -177,10 +258,6 @@ def test_choice_field_with_values_of_a_weird_type():
     }
 
 
-@pytest.mark.xfail(
-    reason="TODO: it isn't trivial how to fix this, without having to rework the "
-    "from_dict from simple-parsing."
-)
 def test_replace_int_or_float_preserves_type():
     @dataclass
     class A(HyperParameters):
@@ -195,6 +272,30 @@ def test_replace_int_or_float_preserves_type():
     assert isinstance(a.limit_test_batches, float)
     b = a.replace(limit_train_batches=0.5)
     assert isinstance(b.limit_test_batches, float)
+    assert b.limit_train_batches == 0.5
+
+
+def test_replace_decodes_values():
+    c = C(lr=0.1, momentum=0.9)
+    assert c.replace(lr="0.01") == C(lr=0.01, momentum=0.9)
+    assert isinstance(c.replace(lr="0.01").lr, float)
+    assert isinstance(c.replace(momentum=1).momentum, float)
+
+
+def test_replace_nested():
+    @dataclass
+    class Child(HyperParameters):
+        foo: int = uniform(0, 10, default=5)
+
+    @dataclass
+    class Parent(HyperParameters):
+        child: Child = mutable_field(Child, foo=3)
+        lr: float = uniform(0.0, 1.0, default=0.1)
+
+    parent = Parent()
+    assert parent.replace(lr=0.5) == Parent(child=Child(foo=3), lr=0.5)
+    assert parent.replace(child={"foo": 7}) == Parent(child=Child(foo=7), lr=0.1)
+    assert parent.replace(child=Child(foo=7), lr=0.2) == Parent(child=Child(foo=7), lr=0.2)
 
 
 try:
@@ -267,3 +368,57 @@ def test_field_types():
         assert all(c.f.dtype == int for c in cs)
     else:
         assert all(all(isinstance(v, int) for v in c.f) for c in cs)
+
+
+def test_points():
+    a, b, c = C(lr=0.1, momentum=0.9), C(lr=0.2, momentum=0.8), C(lr=0.3, momentum=0.7)
+    points = [Point(a, 0.5), Point(b, 0.1), Point(c, 0.3)]
+    assert sorted(points, key=perf_key) == [points[1], points[2], points[0]]
+    assert sorted([tuple(p) for p in points], key=perf_key) == [points[1], points[2], points[0]]
+    assert sorted(points) == [points[1], points[2], points[0]]
+    assert max(points) == points[0]
+    assert points[1] < points[2] <= points[0]
+    assert points[0] > points[2] >= points[1]
+
+    assert point_equal(points[0], Point(C(lr=0.1, momentum=0.9), 0.5))
+    assert point_equal(points[0], (a.to_dict(), 0.5))
+    assert not point_equal(points[0], (a.to_dict(), 0.6))
+    assert not point_equal(points[0], (b.to_dict(), 0.5))
+    assert not point_equal(points[0], ("foo", 0.5))
+    assert not point_equal(("foo", 0.5), (a.to_dict(), 0.5))
+    assert point_equal(("foo", 0.5), ("foo", 0.5))
+
+    assert points[0] == Point(C(lr=0.1, momentum=0.9), 0.5)
+    assert points[0] == (a.to_dict(), 0.5)
+    assert points[0] != (a.to_dict(), 0.6)
+    assert points[0] != (b.to_dict(), 0.5)
+    assert points[0] != (a, 0.5, "extra")
+
+
+def test_id_is_cached():
+    c = C(lr=0.1, momentum=0.9)
+    assert c.id() is c.id()
+    assert c.id() == C(lr=0.1, momentum=0.9).id()
+    c_id = c.id()
+    c.lr = 0.2
+    assert c.id() != c_id
+
+
+def test_id_changes_when_mutable_field_is_modified():
+    @dataclass
+    class Child(HyperParameters):
+        foo: int = uniform(0, 10, default=5)
+
+    @dataclass
+    class Parent(HyperParameters):
+        child: Child = mutable_field(Child)
+        values: list = list_field()
+
+    parent = Parent(values=[1, 2])
+    parent_id = parent.id()
+    parent.values.append(3)
+    assert parent.id() != parent_id
+
+    parent_id = parent.id()
+    parent.child.foo = 7
+    assert parent.id() != parent_id
@@ -43,6 +43,13 @@ class Prior(Generic[T]):
     def sample(self) -> T:
         pass
 
+    def sample_many(self, n: int) -> Union["np.ndarray", List[T]]:
+        """Draws `n` independent samples from this prior.
+
+        Priors that can draw all the samples at once (with numpy) override this.
+        """
+        return [self.sample() for _ in range(n)]
+
     def seed(self, seed: Optional[int]) -> None:
         # Should this seed this individual prior?
         if numpy_installed:
@@ -94,6 +101,14 @@ class NormalPrior(Prior):
             return round(value)
         return value
 
+    def sample_many(self, n: int) -> Union["np.ndarray", List[Union[float, int]]]:
+        if self.shape or not numpy_installed:
+            return super().sample_many(n)
+        values = self.np_rng.normal(self.mu, self.sigma, size=n)
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return values
+
     def get_orion_space_string(self) -> str:
         raise NotImplementedError(
             "TODO: Add this for the normal prior, didn't check how its done in " "Orion yet."
@@ -145,6 +160,14 @@ class UniformPrior(Prior):
             return round(value)
         return value
 
+    def sample_many(self, n: int) -> Union["np.ndarray", List[Union[float, int]]]:
+        if self.shape or not numpy_installed:
+            return super().sample_many(n)
+        values = self.np_rng.uniform(self.min, self.max, size=n)
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return values
+
     def get_orion_space_string(self) -> str:
         string = f"uniform({self.min}, {self.max}"
         if self.discrete:
@@ -199,10 +222,10 @@ class CategoricalPrior(Prior[T]):
             choices = self.choices
             probabilities = self.probabilities
 
-        print(choices, n, probabilities)
         if numpy_installed:
-            s = self.np_rng.choice(choices, size=n, p=probabilities)
-            samples = [(s_i.item() if isinstance(s_i, np.ndarray) else s_i) for s_i in s]
+            s = self.np_rng.choice(choices, size=n or 1, p=probabilities)
+            # NOTE: `tolist` converts all the numpy scalars back to python values at once.
+            samples = s.tolist()
         else:
             samples = self.rng.choices(choices, weights=probabilities, k=n or 1)
 
@@ -277,6 +300,17 @@ class LogUniformPrior(Prior):
             return round(value)
         return value
 
+    def sample_many(self, n: int) -> Union["np.ndarray", List[float]]:
+        if self.shape or not numpy_installed:
+            return super().sample_many(n)
+        assert self.min > 0, "min of LogUniform can't be negative!"
+        assert self.min < self.max, "max should be greater than min!"
+        log_vals = self.np_rng.uniform(self.log_min, self.log_max, size=n)
+        values = np.power(self.base, log_vals)
+        if self.discrete:
+            values = np.round(values).astype(int)
+        return values
+
     @property
     def log_min(self) -> Union[int, float]:
         if numpy_installed:
@@ -128,6 +128,18 @@ def test_categorical_prior():
     assert 700 <= counter["c"] <= 900
 
 
+@pytest.mark.parametrize("choices", [["foo", "bar"], [1, 2, 3], [1.5, 2.5]])
+def test_categorical_prior_gives_python_values(choices: list):
+    prior = CategoricalPrior(choices)
+    value = prior.sample()
+    assert value in choices
+    assert type(value) is type(choices[0])
+
+    values = prior.sample(10)
+    assert len(values) == 10
+    assert all(type(v) is type(choices[0]) for v in values)
+
+
 def test_log_uniform_with_shape():
     prior = LogUniformPrior(min=1e-6, max=1, default=0.001, shape=2)
     assert len(prior.sample()) == 2
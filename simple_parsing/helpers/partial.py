@@ -23,6 +23,7 @@ from typing import (
 from typing_extensions import ParamSpec, TypeVar
 
 import simple_parsing
+from simple_parsing.utils import get_dataclass_fields
 
 __all__ = ["Partial", "adjust_default", "config_for", "infer_type_annotation_from_default"]
 
@@ -301,7 +302,7 @@ class Partial(functools.partial, Generic[_T], metaclass=_Partial):
 
     def __call__(self: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
         constructor_kwargs = {
-            field.name: getattr(self, field.name) for field in dataclasses.fields(self)
+            field.name: getattr(self, field.name) for field in get_dataclass_fields(type(self))
         }
         constructor_kwargs.update(**kwargs)
         # TODO: Use `nested_partial` as a base class? (to instantiate all the partials inside as
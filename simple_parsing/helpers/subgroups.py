@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 import inspect
 import typing
+import weakref
 from dataclasses import _MISSING_TYPE, MISSING
 from enum import Enum
 from logging import getLogger as get_logger
@@ -97,7 +98,18 @@ def subgroups(
     elif default is not MISSING and default not in subgroups.keys():
         raise ValueError("default must be a key in the subgroups dict!")
 
-    if default_factory is not MISSING and default_factory not in list(subgroups.values()):
+    # The keys associated with the `default_factory` in the subgroups dict, found using `is` and
+    # using `==`, in a single pass over the items.
+    default_factory_keys_is: list[Key] = []
+    default_factory_keys_eq: list[Key] = []
+    if default_factory is not MISSING:
+        for subgroup_key, subgroup_value in subgroups.items():
+            if subgroup_value is default_factory:
+                default_factory_keys_is.append(subgroup_key)
+            elif subgroup_value == default_factory:
+                default_factory_keys_eq.append(subgroup_key)
+
+    if default_factory is not MISSING and not (default_factory_keys_is or default_factory_keys_eq):
         # NOTE: This is because we need to have a "default key" to associate with the
         # default_factory (and we set that as the default value for the argument of this field).
         raise ValueError("`default_factory` must be a value in the subgroups dict.")
@@ -175,10 +187,8 @@ def subgroups(
     elif default_factory is not MISSING:
         # assert default_factory in subgroups.values()
         # default_factory passed, which is in the subgroups dict. Find the matching key.
-        matching_keys = [k for k, v in subgroups.items() if v is default_factory]
-        if not matching_keys:
-            # Use == instead of `is` this time.
-            matching_keys = [k for k, v in subgroups.items() if v == default_factory]
+        # If there aren't any matches using `is`, use the matches found using `==`.
+        matching_keys = default_factory_keys_is or default_factory_keys_eq
 
         # We wouldn't get here if default_factory wasn't in the subgroups dict values.
         assert matching_keys
@@ -204,13 +214,38 @@ def subgroups(
     )  # type: ignore
 
 
+# Cache of the results of `_get_dataclass_type_from_callable`, since inspecting the signature of
+# the callables is slow, and the same callables (e.g. partials) can be used in many subgroups.
+_dataclass_type_from_callable_cache: weakref.WeakKeyDictionary[Callable[..., Any], type] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def _get_dataclass_type_from_callable(
     dataclass_fn: Callable[..., DataclassT], caller_frame: inspect.FrameType | None = None
 ) -> type[DataclassT]:
     """Inspects and returns the type of dataclass that the given callable will return."""
     if is_dataclass_type(dataclass_fn):
         return dataclass_fn
-
+    try:
+        return _dataclass_type_from_callable_cache[dataclass_fn]
+    except (KeyError, TypeError):
+        # TypeError: The callable can't be used as a key (not hashable or not weak-referenceable).
+        pass
+    dataclass_type = _get_dataclass_type_from_callable_uncached(
+        dataclass_fn, caller_frame=caller_frame
+    )
+    try:
+        _dataclass_type_from_callable_cache[dataclass_fn] = dataclass_type
+    except TypeError:
+        pass
+    return dataclass_type
+
+
+def _get_dataclass_type_from_callable_uncached(
+    dataclass_fn: Callable[..., DataclassT], caller_frame: inspect.FrameType | None = None
+) -> type[DataclassT]:
+    """Same as `_get_dataclass_type_from_callable`, without caching the result."""
     signature = inspect.signature(dataclass_fn)
 
     if isinstance(dataclass_fn, functools.partial):
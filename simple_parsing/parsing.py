@@ -13,7 +13,7 @@ import sys
 import typing
 from argparse import SUPPRESS, Action, HelpFormatter, Namespace, _
 from collections import defaultdict
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
 from typing import Any, Callable, Sequence, Type, overload
 
@@ -38,7 +38,7 @@ logger = getLogger(__name__)
 
 
 class ParsingError(RuntimeError, SystemExit):
-    pass
+    __slots__ = ()
 
 
 class ArgumentParser(argparse.ArgumentParser):
@@ -129,6 +129,14 @@ class ArgumentParser(argparse.ArgumentParser):
 
         self._conflict_resolver = ConflictResolver(self.conflict_resolution)
         self._wrappers: list[DataclassWrapper] = []
+        # Index of the wrappers in `self._wrappers` by destination, used to check for duplicates.
+        self._wrappers_by_dest: dict[str, list[DataclassWrapper]] = {}
+        # The subgroup fields of the wrappers, computed in `_preprocessing`. This is reused in
+        # each call to `parse_known_args`, until the wrappers change.
+        self._subgroup_fields: dict[str, FieldWrapper] | None = None
+        # The (field, dest) pairs consumed from the namespace for each wrapper, computed once per
+        # wrapper after preprocessing (see `_get_fields_to_consume`).
+        self._fields_to_consume: dict[DataclassWrapper, tuple[tuple[FieldWrapper, str], ...]] = {}
 
         if add_dest_to_option_strings:
             argument_generation_mode = ArgumentGenerationMode.BOTH
@@ -268,6 +276,8 @@ class ArgumentParser(argparse.ArgumentParser):
             dataclass_wrapper_class=dataclass_wrapper_class,
         )
         self._wrappers.append(new_wrapper)
+        self._wrappers_by_dest.setdefault(new_wrapper.dest, []).append(new_wrapper)
+        self._subgroup_fields = None
         return new_wrapper
 
     def parse_known_args(
@@ -282,8 +292,9 @@ class ArgumentParser(argparse.ArgumentParser):
         if args is None:
             # args default to the system args
             args = sys.argv[1:]
-        else:
-            # make sure that args are mutable
+        elif not isinstance(args, list):
+            # make sure that args are a list.
+            # NOTE: No need to copy a list that is passed, since it isn't modified in-place.
             args = list(args)
 
         # default Namespace built from parser defaults
@@ -298,13 +309,9 @@ class ArgumentParser(argparse.ArgumentParser):
                 self.set_defaults(config_file)
 
         if self.add_config_path_arg:
-            temp_parser = ArgumentParser(
-                add_config_path_arg=False,
-                add_help=False,
-                add_option_string_dash_variants=FieldWrapper.add_dash_variants,
-                argument_generation_mode=FieldWrapper.argument_generation_mode,
-                nested_mode=FieldWrapper.nested_mode,
-            )
+            # NOTE: Use a plain argparse parser here, since this temporary parser only ever has
+            # the `--config_path` argument, and doesn't need any of the dataclass machinery.
+            temp_parser = argparse.ArgumentParser(add_help=False)
             temp_parser.add_argument(
                 "--config_path",
                 type=Path,
@@ -332,7 +339,7 @@ class ArgumentParser(argparse.ArgumentParser):
         assert isinstance(args, list)
         self._preprocessing(args=args, namespace=namespace)
 
-        logger.debug(f"Parser {id(self)} is parsing args: {args}, namespace: {namespace}")
+        logger.debug("Parser %s is parsing args: %s, namespace: %s", id(self), args, namespace)
         parsed_args, unparsed_args = super().parse_known_args(args, namespace)
 
         if unparsed_args and self._subparsers and attempt_to_reorder:
@@ -464,15 +471,14 @@ class ArgumentParser(argparse.ArgumentParser):
         )
         assert dataclass_fn is None or callable(dataclass_fn)
 
-        for wrapper in self._wrappers:
-            if wrapper.dest == name:
-                if wrapper.dataclass == dataclass_type:
-                    raise argparse.ArgumentError(
-                        argument=None,
-                        message=f"Destination attribute {name} is already used for "
-                        f"dataclass of type {dataclass_type}. Make sure all destinations"
-                        f" are unique. (new dataclass type: {dataclass_type})",
-                    )
+        for wrapper in self._wrappers_by_dest.get(name, ()):
+            if wrapper.dataclass == dataclass_type:
+                raise argparse.ArgumentError(
+                    argument=None,
+                    message=f"Destination attribute {name} is already used for "
+                    f"dataclass of type {dataclass_type}. Make sure all destinations"
+                    f" are unique. (new dataclass type: {dataclass_type})",
+                )
         if not isinstance(dataclass_type, type):
             if default is None:
                 default = dataclass_type
@@ -497,13 +503,9 @@ class ArgumentParser(argparse.ArgumentParser):
         ):
             # If we did .set_defaults before we knew what dataclass we're using, then we try to
             # still make use of those defaults:
-            new_wrapper.set_default(
-                {
-                    k: v
-                    for k, v in self._defaults.items()
-                    if k in [f.name for f in dataclasses.fields(new_wrapper.dataclass)]
-                }
-            )
+            # NOTE: Get the field names once, rather than once per default value.
+            field_names = {f.name for f in dataclasses.fields(new_wrapper.dataclass)}
+            new_wrapper.set_default({k: v for k, v in self._defaults.items() if k in field_names})
 
         return new_wrapper
 
@@ -514,7 +516,8 @@ class ArgumentParser(argparse.ArgumentParser):
         if self._preprocessing_done:
             return
 
-        args = list(args)
+        if not isinstance(args, list):
+            args = list(args)
 
         wrapped_dataclasses = self._wrappers.copy()
         # Fix the potential conflicts between dataclass fields with the same names.
@@ -531,12 +534,19 @@ class ArgumentParser(argparse.ArgumentParser):
         # Create one argument group per dataclass
         for wrapped_dataclass in wrapped_dataclasses:
             logger.debug(
-                f"Parser {id(self)} is Adding arguments for dataclass: {wrapped_dataclass.dataclass} "
-                f"at destinations {wrapped_dataclass.destinations}"
+                "Parser %s is Adding arguments for dataclass: %s at destinations %s",
+                id(self),
+                wrapped_dataclass.dataclass,
+                wrapped_dataclass.destinations,
             )
             wrapped_dataclass.add_arguments(parser=self)
 
         self._wrappers = wrapped_dataclasses
+        self._wrappers_by_dest = {}
+        for wrapper in wrapped_dataclasses:
+            self._wrappers_by_dest.setdefault(wrapper.dest, []).append(wrapper)
+        self._subgroup_fields = _get_subgroup_fields(wrapped_dataclasses)
+        self._fields_to_consume = {}
         # Save this so we don't re-add all the arguments.
         self._preprocessing_done = True
 
@@ -563,13 +573,16 @@ class ArgumentParser(argparse.ArgumentParser):
             i.e. with `parser.add_argument(...)`.
         """
         logger.debug("\nPOST PROCESSING\n")
-        logger.debug(f"(raw) parsed args: {parsed_args}")
+        logger.debug("(raw) parsed args: %s", parsed_args)
 
         self._remove_subgroups_from_namespace(parsed_args)
         # create the constructor arguments for each instance by consuming all
         # the relevant attributes from `parsed_args`
         wrappers = _flatten_wrappers(self._wrappers)
 
+        # NOTE: This is the only copy of the constructor arguments that is made during
+        # postprocessing: it is filled in-place with the values of the fields, and then consumed
+        # in-place (bottom-up) when creating the dataclass instances.
         constructor_arguments = self.constructor_arguments.copy()
         for wrapper in wrappers:
             for destination in wrapper.destinations:
@@ -636,9 +649,12 @@ class ArgumentParser(argparse.ArgumentParser):
             # Do rounds of parsing with just the subgroup arguments, until all the subgroups
             # are resolved to a dataclass type.
             logger.debug(
-                f"Starting subgroup parsing round {current_nesting_level}: {list(unresolved_subgroups.keys())}"
+                "Starting subgroup parsing round %s: %s",
+                current_nesting_level,
+                list(unresolved_subgroups.keys()),
             )
             # Add all the unresolved subgroups arguments.
+            added_arguments: list[tuple[list[str], dict[str, Any]]] = []
             for dest, subgroup_field in unresolved_subgroups.items():
                 flags = subgroup_field.option_strings
                 argument_options = subgroup_field.arg_options
@@ -655,19 +671,32 @@ class ArgumentParser(argparse.ArgumentParser):
                     argument_options["default"] = argparse.SUPPRESS
 
                 logger.debug(
-                    f"Adding subgroup argument: add_argument(*{flags} **{str(argument_options)})"
+                    "Adding subgroup argument: add_argument(*%s **%s)", flags, argument_options
                 )
                 subgroup_choice_parser.add_argument(*flags, **argument_options)
+                added_arguments.append((flags, argument_options))
 
             # Parse `args` repeatedly until all the subgroup choices are resolved.
-            parsed_args, unused_args = subgroup_choice_parser.parse_known_args(
-                args=args, namespace=namespace
-            )
+            # NOTE: When none of the new subgroup arguments are in `args`, parsing them again would
+            # just give back their default values, so we use these directly instead.
+            parsed_args = _get_default_subgroup_choices(added_arguments, args, namespace)
+            unused_args = None
+            if parsed_args is None:
+                parsed_args, unused_args = subgroup_choice_parser.parse_known_args(
+                    args=args, namespace=namespace
+                )
             logger.debug(
-                f"Nesting level {current_nesting_level}: args: {args}, "
-                f"parsed_args: {parsed_args}, unused_args: {unused_args}"
+                "Nesting level %s: args: %s, parsed_args: %s, unused_args: %s",
+                current_nesting_level,
+                args,
+                parsed_args,
+                unused_args,
             )
 
+            # All the wrappers currently in the tree. The subgroups resolved in this round are all
+            # fields of these wrappers, and the new wrappers are only added as their children.
+            wrappers_in_tree = set(_flatten_wrappers(wrappers))
+
             for dest, subgroup_field in list(unresolved_subgroups.items()):
                 # NOTE: There should always be a parsed value for the subgroup argument on the
                 # namespace. This is because we added all the subgroup arguments before we get
@@ -683,8 +712,9 @@ class ArgumentParser(argparse.ArgumentParser):
                 # chosen dataclass type (as we're doing below).
                 # subgroup_field.set_default(chosen_subgroup_key)
                 logger.debug(
-                    f"resolved the subgroup at {dest!r}: will use the subgroup at key "
-                    f"{chosen_subgroup_key!r}"
+                    "resolved the subgroup at %r: will use the subgroup at key %r",
+                    dest,
+                    chosen_subgroup_key,
                 )
 
                 default_or_dataclass_fn = subgroup_dict[chosen_subgroup_key]
@@ -696,15 +726,13 @@ class ArgumentParser(argparse.ArgumentParser):
                 else:
                     default = None
                     dataclass_fn = default_or_dataclass_fn
-                    dataclass_type = subgroup_field.field.metadata["subgroup_dataclass_types"][
-                        chosen_subgroup_key
-                    ]
+                    dataclass_type = subgroup_field.subgroup_dataclass_types[chosen_subgroup_key]
 
                 assert default is None or is_dataclass_instance(default)
                 assert callable(dataclass_fn)
                 assert is_dataclass_type(dataclass_type)
 
-                name = dest.split(".")[-1]
+                name = dest.rpartition(".")[2]
                 parent_dataclass_wrapper = subgroup_field.parent
                 # NOTE: Using self._add_arguments so it returns the modified wrapper and doesn't
                 # affect the `self._wrappers` list.
@@ -718,12 +746,12 @@ class ArgumentParser(argparse.ArgumentParser):
                 # Make the new wrapper a child of the class which contains the field.
                 # - it isn't already a child
                 # - it's parent is the parent dataclass wrapper
-                # - the parent is already in the tree of DataclassWrappers.
+                # - the parent is already in the tree of DataclassWrappers (and therefore so is the
+                #   new wrapper, without having to flatten the whole tree again).
                 assert new_wrapper not in parent_dataclass_wrapper._children
                 parent_dataclass_wrapper._children.append(new_wrapper)
                 assert new_wrapper.parent is parent_dataclass_wrapper
-                assert parent_dataclass_wrapper in _flatten_wrappers(wrappers)
-                assert new_wrapper in _flatten_wrappers(wrappers)
+                assert parent_dataclass_wrapper in wrappers_in_tree
 
                 # Mark this subgroup as resolved.
                 unresolved_subgroups.pop(dest)
@@ -744,18 +772,19 @@ class ArgumentParser(argparse.ArgumentParser):
             unresolved_subgroups = {
                 k: v for k, v in all_subgroup_fields.items() if k not in resolved_subgroups
             }
-            logger.debug(f"All subgroups: {list(all_subgroup_fields.keys())}")
-            logger.debug(f"Resolved subgroups: {resolved_subgroups}")
-            logger.debug(f"Unresolved subgroups: {list(unresolved_subgroups.keys())}")
+            logger.debug("All subgroups: %s", list(all_subgroup_fields.keys()))
+            logger.debug("Resolved subgroups: %s", resolved_subgroups)
+            logger.debug("Unresolved subgroups: %s", list(unresolved_subgroups.keys()))
 
             if not unresolved_subgroups:
                 logger.debug("Done parsing all the subgroups!")
                 break
             else:
                 logger.debug(
-                    f"Done parsing a round of subparsers at nesting level "
-                    f"{current_nesting_level}. Moving to the next round which has "
-                    f"{len(unresolved_subgroups)} unresolved subgroup choices."
+                    "Done parsing a round of subparsers at nesting level %s. Moving to the next "
+                    "round which has %s unresolved subgroup choices.",
+                    current_nesting_level,
+                    len(unresolved_subgroups),
                 )
         return wrappers, resolved_subgroups
 
@@ -764,8 +793,10 @@ class ArgumentParser(argparse.ArgumentParser):
 
         Modifies the namespace in-place.
         """
-        # find all subgroup fields
-        subgroup_fields = _get_subgroup_fields(self._wrappers)
+        # find all subgroup fields (reusing the ones found during preprocessing, if possible).
+        subgroup_fields = self._subgroup_fields
+        if subgroup_fields is None:
+            subgroup_fields = _get_subgroup_fields(self._wrappers)
 
         if not subgroup_fields:
             return
@@ -807,7 +838,8 @@ class ArgumentParser(argparse.ArgumentParser):
 
         constructor_arguments : dict[str, dict[str, Any]]
             The partially populated dict of constructor arguments for each dataclass. This will be
-            consumed in order to create the dataclass instances for each DataclassWrapper.
+            consumed (in-place) in order to create the dataclass instances for each
+            DataclassWrapper.
 
         Returns
         -------
@@ -815,7 +847,6 @@ class ArgumentParser(argparse.ArgumentParser):
             The transformed namespace with the instances set at their
             corresponding destinations.
         """
-        constructor_arguments = constructor_arguments.copy()
         # FIXME: There's a bug here happening with the `ALWAYS_MERGE` case: The namespace has the
         # values, but the constructor arguments dict doesn't.
 
@@ -823,77 +854,111 @@ class ArgumentParser(argparse.ArgumentParser):
             assert len(wrappers) == len(constructor_arguments), "should have one dict per wrapper"
 
         # sort the wrappers so as to construct the leaf nodes first.
-        sorted_dc_wrappers: list[DataclassWrapper] = sorted(
-            wrappers, key=lambda w: w.nesting_level, reverse=True
-        )
-        assert len(sorted_dc_wrappers) == len(set(sorted_dc_wrappers))
-
-        for dc_wrapper in sorted_dc_wrappers:
-            logger.debug(f"Instantiating the wrapper with destinations {dc_wrapper.destinations}")
-
-            for destination in dc_wrapper.destinations:
-                logger.debug(f"Instantiating the dataclass at destination {destination}")
-                # Instantiate the dataclass by passing the constructor arguments
-                # to the constructor.
-                constructor = dc_wrapper.dataclass_fn
-                constructor_args = constructor_arguments.pop(destination)
-                # If the dataclass wrapper is marked as 'optional' and all the
-                # constructor args are None, then the instance is None.
-                value_for_dataclass_field: Any | dict[str, Any] | None
-                if argparse.SUPPRESS in dc_wrapper.defaults:
-                    if constructor_args == {}:
-                        value_for_dataclass_field = None
-                    else:
-                        # Don't create the dataclass instance. Instead, keep the value as a dict.
-                        value_for_dataclass_field = constructor_args
+        # NOTE: The nesting levels are small integers, so we group the wrappers by nesting level
+        # (keeping their order within each level) rather than sorting the whole list.
+        wrappers_by_nesting_level: dict[int, list[DataclassWrapper]] = defaultdict(list)
+        for wrapper in wrappers:
+            wrappers_by_nesting_level[wrapper.nesting_level].append(wrapper)
+        assert len(wrappers) == len(set(wrappers))
+
+        for nesting_level in sorted(wrappers_by_nesting_level, reverse=True):
+            # NOTE: Only the wrappers at nesting level 0 don't have a parent. Their values are set
+            # on the namespace, while the others are passed to the constructor of their parent.
+            is_root = nesting_level == 0
+            for dc_wrapper in wrappers_by_nesting_level[nesting_level]:
+                self._instantiate_dataclasses_of_wrapper(
+                    parsed_args,
+                    dc_wrapper,
+                    constructor_arguments=constructor_arguments,
+                    is_root=is_root,
+                )
+
+        # We should be consuming all the constructor arguments.
+        assert not constructor_arguments
+
+        return parsed_args
+
+    def _instantiate_dataclasses_of_wrapper(
+        self,
+        parsed_args: argparse.Namespace,
+        dc_wrapper: DataclassWrapper,
+        constructor_arguments: dict[str, dict[str, Any]],
+        is_root: bool,
+    ) -> None:
+        """Creates the instances for each destination of `dc_wrapper`.
+
+        The instances of the root wrappers are set on the namespace, while the others are set in
+        the constructor arguments of their parent (consuming their own constructor arguments).
+        """
+        logger.debug("Instantiating the wrapper with destinations %s", dc_wrapper.destinations)
+        # These don't change between the destinations of the wrapper.
+        constructor = dc_wrapper.dataclass_fn
+        suppressed = argparse.SUPPRESS in dc_wrapper.defaults
+
+        for destination in dc_wrapper.destinations:
+            logger.debug("Instantiating the dataclass at destination %s", destination)
+            # Instantiate the dataclass by passing the constructor arguments
+            # to the constructor.
+            constructor_args = constructor_arguments.pop(destination)
+            # If the dataclass wrapper is marked as 'optional' and all the
+            # constructor args are None, then the instance is None.
+            value_for_dataclass_field: Any | dict[str, Any] | None
+            if suppressed:
+                if constructor_args == {}:
+                    value_for_dataclass_field = None
                 else:
-                    value_for_dataclass_field = _create_dataclass_instance(
-                        dc_wrapper, constructor, constructor_args
-                    )
+                    # Don't create the dataclass instance. Instead, keep the value as a dict.
+                    value_for_dataclass_field = constructor_args
+            else:
+                value_for_dataclass_field = _create_dataclass_instance(
+                    dc_wrapper, constructor, constructor_args
+                )
 
-                if argparse.SUPPRESS in dc_wrapper.defaults and value_for_dataclass_field is None:
-                    logger.debug(
-                        f"Suppressing entire destination {destination} because none of its"
-                        f"subattributes were specified on the command line."
-                    )
+            if suppressed and value_for_dataclass_field is None:
+                logger.debug(
+                    "Suppressing entire destination %s because none of its subattributes "
+                    "were specified on the command line.",
+                    destination,
+                )
 
-                elif dc_wrapper.parent is not None:
-                    parent_key, attr = utils.split_dest(destination)
-                    logger.debug(
-                        f"Setting a value of {value_for_dataclass_field} at attribute {attr} in "
-                        f"parent at key {parent_key}."
-                    )
-                    constructor_arguments[parent_key][attr] = value_for_dataclass_field
+            elif not is_root:
+                parent_key, attr = utils.split_dest(destination)
+                logger.debug(
+                    "Setting a value of %s at attribute %s in parent at key %s.",
+                    value_for_dataclass_field,
+                    attr,
+                    parent_key,
+                )
+                constructor_arguments[parent_key][attr] = value_for_dataclass_field
 
-                elif not hasattr(parsed_args, destination):
+            elif not hasattr(parsed_args, destination):
+                logger.debug(
+                    "setting attribute '%s' on the Namespace to a value of %s",
+                    destination,
+                    value_for_dataclass_field,
+                )
+                setattr(parsed_args, destination, value_for_dataclass_field)
+
+            else:
+                # There is a collision: namespace already has an entry at this destination.
+                existing = getattr(parsed_args, destination)
+                if dc_wrapper.dest in self._defaults:
                     logger.debug(
-                        f"setting attribute '{destination}' on the Namespace "
-                        f"to a value of {value_for_dataclass_field}"
+                        "Overwriting defaults in the namespace at destination '%s' on the "
+                        "Namespace (%s) to a value of %s",
+                        destination,
+                        existing,
+                        value_for_dataclass_field,
                     )
                     setattr(parsed_args, destination, value_for_dataclass_field)
-
                 else:
-                    # There is a collision: namespace already has an entry at this destination.
-                    existing = getattr(parsed_args, destination)
-                    if dc_wrapper.dest in self._defaults:
-                        logger.debug(
-                            f"Overwriting defaults in the namespace at destination '{destination}' "
-                            f"on the Namespace ({existing}) to a value of {value_for_dataclass_field}"
-                        )
-                        setattr(parsed_args, destination, value_for_dataclass_field)
-                    else:
-                        raise RuntimeError(
-                            f"Namespace should not already have a '{destination}' "
-                            f"attribute!\n"
-                            f"The value would be overwritten:\n"
-                            f"- existing value: {existing}\n"
-                            f"- new value:      {value_for_dataclass_field}"
-                        )
-
-        # We should be consuming all the constructor arguments.
-        assert not constructor_arguments
-
-        return parsed_args
+                    raise RuntimeError(
+                        f"Namespace should not already have a '{destination}' "
+                        f"attribute!\n"
+                        f"The value would be overwritten:\n"
+                        f"- existing value: {existing}\n"
+                        f"- new value:      {value_for_dataclass_field}"
+                    )
 
     def _fill_constructor_arguments_with_fields(
         self,
@@ -918,8 +983,8 @@ class ArgumentParser(argparse.ArgumentParser):
             `add_arguments`.
 
         constructor_arguments : dict[str, dict[str, Any]]
-            The dict of constructor arguments to create for each dataclass. This will be filled by
-            each FieldWrapper.
+            The dict of constructor arguments to create for each dataclass. This will be filled
+            (in-place) by each FieldWrapper.
 
         Returns
         -------
@@ -932,32 +997,33 @@ class ArgumentParser(argparse.ArgumentParser):
                 initial_constructor_arguments
             ), "should have one dict per wrapper"
 
-        # The output
-        constructor_arguments = initial_constructor_arguments.copy()
+        # The output (filled in-place).
+        constructor_arguments = initial_constructor_arguments
 
+        # NOTE: This is the namespace's own `__dict__`, not a copy. The values are popped from it
+        # as they are consumed, which removes them from the namespace at the same time. This is
+        # safe since the fields don't write to the namespace, and the dataclass instances are
+        # only set on it afterwards, in `_instantiate_dataclasses`.
         parsed_arg_values = vars(parsed_args)
-        deleted_values: dict[str, Any] = {}
+        # The consumed values are only kept around so they can be logged.
+        deleted_values: dict[str, Any] | None = {} if logger.isEnabledFor(DEBUG) else None
 
         for wrapper in wrappers:
-            for field in wrapper.fields:
-                if argparse.SUPPRESS in wrapper.defaults and field.dest not in parsed_args:
-                    continue
-
-                if field.is_subgroup:
-                    # Skip the subgroup fields, since we added a child DataclassWrapper for them.
-                    logger.debug(f"Not calling the subgroup FieldWrapper for dest {field.dest}")
-                    continue
-
-                if not field.field.init:
-                    # The field isn't an argument of the dataclass constructor.
+            suppressed = argparse.SUPPRESS in wrapper.defaults
+            for field, dest in self._get_fields_to_consume(wrapper):
+                if suppressed and dest not in parsed_arg_values:
                     continue
 
                 # NOTE: If the field is reused (when using the ConflictResolution.ALWAYS_MERGE
                 # strategy), then we store the multiple values in the `dest` of the first field.
                 # They are they distributed in `constructor_arguments` using the
                 # `field.destinations`, which gives the destination for each value.
-                values = parsed_arg_values.pop(field.dest, field.default)
-                deleted_values[field.dest] = values
+                if dest in parsed_arg_values:
+                    values = parsed_arg_values.pop(dest)
+                else:
+                    values = field.default
+                if deleted_values is not None:
+                    deleted_values[dest] = values
 
                 # call the "action" for the given attribute. This sets the right
                 # value in the `constructor_arguments` dictionary.
@@ -968,14 +1034,35 @@ class ArgumentParser(argparse.ArgumentParser):
                     constructor_arguments=constructor_arguments,
                 )
 
-        # "Clean up" the Namespace by returning a new Namespace without the
-        # consumed attributes.
-        leftover_args = argparse.Namespace(**parsed_arg_values)
+        # NOTE: The consumed attributes were popped from `vars(parsed_args)`, so the namespace is
+        # already "cleaned up" in-place.
         if deleted_values:
-            logger.debug(f"deleted values: {deleted_values}")
-            logger.debug(f"leftover args: {leftover_args}")
+            logger.debug("deleted values: %s", deleted_values)
+            logger.debug("leftover args: %s", parsed_args)
 
-        return leftover_args, constructor_arguments
+        return parsed_args, constructor_arguments
+
+    def _get_fields_to_consume(
+        self, wrapper: DataclassWrapper
+    ) -> tuple[tuple[FieldWrapper, str], ...]:
+        """Returns the fields of `wrapper` whose values are consumed from the namespace, along
+        with their `dest`.
+
+        Computing the `dest` of a field isn't free (it walks up the parents of the field), and it
+        doesn't change once the conflicts are resolved, so this is cached for each wrapper.
+        """
+        fields_to_consume = self._fields_to_consume.get(wrapper)
+        if fields_to_consume is None:
+            # NOTE: Skip the subgroup fields, since we added a child DataclassWrapper for them, as
+            # well as fields that aren't arguments of the dataclass constructor (those normally
+            # don't get a FieldWrapper in the first place).
+            fields_to_consume = tuple(
+                (field, field.dest)
+                for field in wrapper.fields
+                if field.field.init and not field.is_subgroup
+            )
+            self._fields_to_consume[wrapper] = fields_to_consume
+        return fields_to_consume
 
     @property
     def confilct_resolver_max_attempts(self) -> int:
@@ -1079,15 +1166,51 @@ def parse_known_args(
 
 def _get_subgroup_fields(wrappers: list[DataclassWrapper]) -> dict[str, FieldWrapper]:
     subgroup_fields = {}
+    # NOTE: Using a set to check that no field is found twice, rather than searching through the
+    # values of the dict for each field.
+    seen_fields: set[FieldWrapper] = set()
     all_wrappers = _flatten_wrappers(wrappers)
     for wrapper in all_wrappers:
         for field in wrapper.fields:
             if field.is_subgroup:
-                assert field not in subgroup_fields.values()
+                assert field not in seen_fields
+                seen_fields.add(field)
                 subgroup_fields[field.dest] = field
     return subgroup_fields
 
 
+def _get_default_subgroup_choices(
+    subgroup_arguments: list[tuple[list[str], dict[str, Any]]],
+    args: list[str],
+    namespace: Namespace | None,
+) -> Namespace | None:
+    """Returns the namespace that parsing `args` with the given subgroup arguments would produce,
+    when we can tell without parsing that all of them would be at their default value.
+
+    Returns None when the arguments need to be parsed, i.e. when any of the option strings could
+    be in `args`, or when a subgroup argument is required or has a suppressed default.
+    """
+    all_flags = tuple(flag for flags, _options in subgroup_arguments for flag in flags)
+    if any(arg.startswith(all_flags) for arg in args):
+        return None
+    defaults: dict[str, Any] = {}
+    for _flags, argument_options in subgroup_arguments:
+        default = argument_options.get("default")
+        if argument_options.get("required") or default is argparse.SUPPRESS:
+            return None
+        if isinstance(default, str) and argument_options.get("type", str) is not str:
+            # argparse would convert this default value with the `type` function.
+            return None
+        defaults[argument_options["dest"]] = default
+
+    # Same as argparse: the defaults don't overwrite the values already in the namespace.
+    namespace = namespace if namespace is not None else Namespace()
+    for dest, default in defaults.items():
+        if not hasattr(namespace, dest):
+            setattr(namespace, dest, default)
+    return namespace
+
+
 def _remove_duplicates(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
     return list(set(wrappers))
 
@@ -1104,7 +1227,11 @@ def _flatten_wrappers(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper
     """Takes a list of nodes, returns a flattened list of all nodes in the tree."""
     _assert_no_duplicates(wrappers)
     roots_only = _unflatten_wrappers(wrappers)
-    return sum(([w] + list(w.descendants) for w in roots_only), [])
+    flattened: list[DataclassWrapper] = []
+    for wrapper in roots_only:
+        flattened.append(wrapper)
+        flattened.extend(wrapper.descendants)
+    return flattened
 
 
 def _unflatten_wrappers(wrappers: list[DataclassWrapper]) -> list[DataclassWrapper]:
@@ -1127,20 +1254,13 @@ def _create_dataclass_instance(
     # None.
     # TODO: (BUG!) This doesn't distinguish the case where the defaults are passed via the
     # command-line from the case where no arguments are passed at all!
-    if wrapper.optional and wrapper.default is None:
-        for field_wrapper in wrapper.fields:
-            arg_value = constructor_args[field_wrapper.name]
-            default_value = field_wrapper.default
-            logger.debug(
-                f"field {field_wrapper.name}, arg value: {arg_value}, "
-                f"default value: {default_value}"
-            )
-            if arg_value != default_value:
-                # Value is not the default value, so an argument must have been passed.
-                # Break, and return the instance.
-                break
-        else:
-            logger.debug(f"All fields for {wrapper.dest} were either at their default, or None.")
-            return None
-    logger.debug(f"Calling constructor: {constructor}(**{constructor_args})")
+    # NOTE: `all` stops at the first value that isn't the default: an argument must have been
+    # passed in that case, so we return the instance.
+    if wrapper.optional and wrapper.default is None and all(
+        constructor_args[field_wrapper.name] == field_wrapper.default
+        for field_wrapper in wrapper.fields
+    ):
+        logger.debug("All fields for %s were either at their default, or None.", wrapper.dest)
+        return None
+    logger.debug("Calling constructor: %s(**%s)", constructor, constructor_args)
     return constructor(**constructor_args)
@@ -14,6 +14,7 @@ from simple_parsing.utils import (
     PossiblyNestedDict,
     V,
     contains_dataclass_type_arg,
+    get_dataclass_fields,
     is_dataclass_instance,
     is_dataclass_type,
     is_optional,
@@ -82,31 +83,34 @@ def replace(obj: DataclassT, changes_dict: dict[str, Any] | None = None, **chang
     if changes_dict and changes:
         raise ValueError("Cannot pass both `changes_dict` and `changes`")
     changes = changes_dict or changes
+    if not any("." in key or isinstance(value, dict) for key, value in changes.items()):
+        # Fast path: There are no nested changes, so the changes can be passed directly to
+        # `dataclasses.replace`, without having to unflatten them or to recurse.
+        for field in get_dataclass_fields(type(obj)):
+            if not field.init and field.name in changes:
+                raise ValueError(f"Cannot replace value of non-init field {field.name}.")
+        return dataclasses.replace(obj, **changes)
+
     # changes can be given in a 'flat' format in `changes_dict`, e.g. {"a.b.c": 123}.
     # Unflatten them back to a nested dict (e.g. {"a": {"b": {"c": 123}}})
     changes = unflatten_split(changes)
 
-    replace_kwargs = {}
-    for field in dataclasses.fields(obj):
+    # NOTE: The nested changes are replaced (in-place) with the new nested dataclasses.
+    # note: there may be some leftover values in `changes` that are not fields of this dataclass.
+    # we still pass those.
+    for field in get_dataclass_fields(type(obj)):
         if field.name not in changes:
             continue
         if not field.init:
             raise ValueError(f"Cannot replace value of non-init field {field.name}.")
 
-        field_value = getattr(obj, field.name)
-
-        if is_dataclass_instance(field_value) and isinstance(changes[field.name], dict):
-            field_changes = changes.pop(field.name)
-            new_value = replace(field_value, **field_changes)
-        else:
-            new_value = changes.pop(field.name)
-        replace_kwargs[field.name] = new_value
-
-    # note: there may be some leftover values in `changes` that are not fields of this dataclass.
-    # we still pass those.
-    replace_kwargs.update(changes)
+        field_changes = changes[field.name]
+        if isinstance(field_changes, dict):
+            field_value = getattr(obj, field.name)
+            if is_dataclass_instance(field_value):
+                changes[field.name] = replace(field_value, **field_changes)
 
-    return dataclasses.replace(obj, **replace_kwargs)
+    return dataclasses.replace(obj, **changes)
 
 
 def replace_subgroups(
@@ -124,7 +128,7 @@ def replace_subgroups(
     selections = _unflatten_selection_dict(selections, keyword, recursive=False)
 
     replace_kwargs = {}
-    for field in dataclasses.fields(obj):
+    for field in get_dataclass_fields(type(obj)):
         if not field.init:
             raise ValueError(f"Cannot replace value of non-init field {field.name}.")
 
@@ -152,7 +156,7 @@ def replace_subgroups(
         if is_dataclass_type(value_of_selection):
             field_value = value_of_selection()
         elif is_dataclass_instance(value_of_selection):
-            field_value = copy.deepcopy(value_of_selection)
+            field_value = _copy_dataclass(value_of_selection)
         elif field.metadata.get("subgroups", None):
             assert isinstance(value_of_selection, str)
             subgroup_selection = field.metadata["subgroups"][value_of_selection]
@@ -180,6 +184,28 @@ def replace_subgroups(
     return dataclasses.replace(obj, **replace_kwargs)
 
 
+# Types whose instances can't be modified, and are therefore never copied by `copy.deepcopy`.
+_IMMUTABLE_TYPES = (str, int, float, bool, complex, bytes, type(None))
+
+
+def _copy_dataclass(obj: DataclassT) -> DataclassT:
+    """Returns a deep copy of the dataclass instance `obj`.
+
+    When all the attributes of `obj` are immutable (e.g. ints or strings), a shallow copy is
+    equivalent to a deep copy, and much cheaper. Attributes stored in `__slots__` aren't in the
+    `__dict__`, so instances of classes that define `__slots__` are always deep-copied.
+    """
+    obj_dict = getattr(obj, "__dict__", None)
+    if (
+        obj_dict is not None
+        and not hasattr(obj, "__deepcopy__")
+        and not any("__slots__" in vars(cls) for cls in type(obj).__mro__)
+        and all(type(value) in _IMMUTABLE_TYPES for value in obj_dict.values())
+    ):
+        return copy.copy(obj)
+    return copy.deepcopy(obj)
+
+
 def _unflatten_selection_dict(
     flattened: Mapping[str, V], keyword: str = "__key__", sep: str = ".", recursive: bool = True
 ) -> PossiblyNestedDict[str, V]:
@@ -203,14 +229,16 @@ def _unflatten_selection_dict(
     """
     dc = {}
 
+    # NOTE: Split each key only once, since the split keys are needed in both loops below.
+    split_keys = {k: k.split(sep) for k in flattened}
+
     unflatten_those_top_level_keys = set()
-    for k, v in flattened.items():
-        splited_keys = k.split(sep)
+    for splited_keys in split_keys.values():
         if len(splited_keys) >= 2:
             unflatten_those_top_level_keys.add(splited_keys[0])
 
     for k, v in flattened.items():
-        keys = k.split(sep)
+        keys = split_keys[k]
         top_level_key = keys[0]
         rest_keys = keys[1:]
         if top_level_key in unflatten_those_top_level_keys:
@@ -12,6 +12,7 @@ import re
 import sys
 import types
 import typing
+import weakref
 from collections import OrderedDict, defaultdict
 from collections import abc as c_abc
 from dataclasses import _MISSING_TYPE, MISSING, Field
@@ -830,6 +831,48 @@ def dict_intersection(*dicts: dict[K, V]) -> Iterable[tuple[K, tuple[V, ...]]]:
         yield (key, tuple(d[key] for d in dicts))
 
 
+# The fields of each dataclass type, with and without the `InitVar` pseudo-fields (see
+# `get_dataclass_fields`). The dataclass types are weakly referenced, so that caching their fields
+# doesn't prevent them from being garbage-collected (e.g. for dataclasses created in functions).
+_dataclass_fields_cache: weakref.WeakKeyDictionary[type, tuple[Field, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+_dataclass_fields_and_initvars_cache: weakref.WeakKeyDictionary[type, tuple[Field, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_dataclass_fields(
+    dataclass_type: type[Dataclass], include_initvars: bool = False
+) -> tuple[Field, ...]:
+    """Returns the fields of a dataclass type, like `dataclasses.fields`.
+
+    When `include_initvars` is True, the `InitVar` pseudo-fields are also returned, in the order in
+    which they are defined.
+
+    NOTE: The result is cached for each dataclass type, since the fields of a dataclass don't
+    change, and this is called many times for the same dataclasses.
+    """
+    cache = _dataclass_fields_and_initvars_cache if include_initvars else _dataclass_fields_cache
+    dataclass_fields = cache.get(dataclass_type)
+    if dataclass_fields is not None:
+        return dataclass_fields
+    # NOTE: `dataclasses.fields` only returns the fields of type `dataclasses._FIELD`, so we
+    # partly copy its implementation to also get the fields of type `dataclasses._FIELD_INITVAR`.
+    try:
+        fields_map: dict[str, Field] = getattr(dataclass_type, dataclasses._FIELDS)  # type: ignore
+    except AttributeError:
+        raise TypeError("must be called with a dataclass type or instance")
+    field_types = (
+        (dataclasses._FIELD, dataclasses._FIELD_INITVAR)  # type: ignore
+        if include_initvars
+        else (dataclasses._FIELD,)  # type: ignore
+    )
+    dataclass_fields = tuple(f for f in fields_map.values() if f._field_type in field_types)
+    cache[dataclass_type] = dataclass_fields
+    return dataclass_fields
+
+
 def field_dict(dataclass: Dataclass) -> dict[str, Field]:
     result: dict[str, Field] = OrderedDict()
     for field in dataclasses.fields(dataclass):
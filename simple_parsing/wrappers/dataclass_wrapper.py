@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import enum
 import functools
 import textwrap
+import weakref
 from dataclasses import MISSING
 from logging import getLogger
 from typing import Any, Callable, Generic, TypeVar, cast
@@ -12,7 +14,7 @@ from typing_extensions import Literal
 
 from simple_parsing import docstring, utils
 from simple_parsing.docstring import dp_parse, inspect_getdoc
-from simple_parsing.utils import Dataclass, DataclassT, is_dataclass_instance, is_dataclass_type
+from simple_parsing.utils import DataclassT, is_dataclass_instance, is_dataclass_type
 from simple_parsing.wrappers.field_wrapper import FieldWrapper
 from simple_parsing.wrappers.wrapper import Wrapper
 
@@ -26,6 +28,13 @@ If fields don't have docstrings or help text, then this is not used, and the ent
 used as the description of the argument group.
 """
 
+# Template for the argument group in the output of `DataclassWrapper.equivalent_argparse_code`.
+_ARGUMENT_GROUP_CODE_TEMPLATE: str = textwrap.dedent(
+    """
+    group = parser.add_argument_group(title="{title}", description="{description}")
+    """
+)
+
 DataclassWrapperType = TypeVar("DataclassWrapperType", bound="DataclassWrapper")
 
 
@@ -61,15 +70,50 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         self.optional: bool = False
 
         self._destinations: list[str] = []
-        self._required: bool = False
+        # NOTE: None means that `required` was never set (which is the same as it being False).
+        self._required: bool | None = None
         self._explicit: bool = False
         self._dest: str = ""
         self._children: list[DataclassWrapper] = []
+        # Holders used to 'cache' the title and description of the argument group.
+        self._title: str | None = None
+        self._description: str | None = None
         # the default value(s).
         # NOTE: This is a list only because of the `ConflictResolution.ALWAYS_MERGE` option.
         self._defaults: list[DataclassT] = [default] if default else []
 
-        dataclass_fields: tuple[dataclasses.Field, ...] = _get_dataclass_fields(dataclass)
+        dataclass_fields: tuple[dataclasses.Field, ...] = utils.get_dataclass_fields(
+            dataclass, include_initvars=True
+        )
+        # These don't change between fields, so only check them once.
+        dataclass_fn_keywords: dict[str, Any] = (
+            dataclass_fn.keywords if isinstance(dataclass_fn, functools.partial) else {}
+        )
+        default_is_dict = isinstance(default, dict)
+        default_is_instance = not default_is_dict and default not in (None, argparse.SUPPRESS)
+
+        # NOTE: Here we'd like to convert the fields types to actual types, in case the
+        # `from __future__ import annotations` feature is used. This is done for all the fields
+        # at once, since the annotations of the dataclass can then be evaluated only once.
+        string_annotated_fields = [
+            field
+            for field in dataclass_fields
+            if isinstance(field.type, str)
+            and field.init
+            and field.metadata.get("cmd", True) is not False
+        ]
+        if string_annotated_fields:
+            from simple_parsing.annotation_utils.get_field_annotations import (
+                get_field_types_from_annotations,
+            )
+
+            field_types = get_field_types_from_annotations(
+                self.dataclass, [field.name for field in string_annotated_fields]
+            )
+            for field in string_annotated_fields:
+                # Modify the `type` of the Field object, in-place.
+                field.type = field_types[field.name]
+
         # Create an object for each field, which is used to compute (and hold) the arguments that
         # will then be passed to `argument_group.add_argument` later.
         # This could eventually be refactored into a stateless thing. But for now it isn't.
@@ -78,29 +122,18 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                 # Don't add arguments for this field.
                 continue
 
-            if isinstance(field.type, str):
-                # NOTE: Here we'd like to convert the fields type to an actual type, in case the
-                # `from __future__ import annotations` feature is used.
-                from simple_parsing.annotation_utils.get_field_annotations import (
-                    get_field_type_from_annotations,
-                )
-
-                field_type = get_field_type_from_annotations(self.dataclass, field.name)
-                # Modify the `type` of the Field object, in-place.
-                field.type = field_type
-            else:
-                field_type = field.type
+            field_type = field.type
 
             # Manually overwrite the field default value with the corresponding attribute of the
             # default for the parent.
             field_default = dataclasses.MISSING
-            if isinstance(dataclass_fn, functools.partial) and field.name in dataclass_fn.keywords:
+            if field.name in dataclass_fn_keywords:
                 # NOTE: We need to override the default value of the field, because since the
                 # dataclass_fn is a partial, and we always set the defaults for all fields in the
                 # constructor arguments dict, those would be passed to the partial, and the value
                 # for that argument in the partial (e.g. `dataclass_fn = partial(A, a=123)`) would
                 # be unused when we call `dataclass_fn(**constructor_args[dataclass_dest])` later.
-                field_default = dataclass_fn.keywords[field.name]
+                field_default = dataclass_fn_keywords[field.name]
                 # TODO: This is currently only really necessary in the case where the dataclass_fn
                 # is a `functools.partial` (e.g. when using subgroups). But the idea of specifying
                 # the default value and passing it here to the wrapper, rather than have the
@@ -109,19 +142,25 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                     f"Got a default value of {field_default} for field {field.name} from "
                     f"inspecting the dataclass function! ({dataclass_fn})"
                 )
-            elif isinstance(default, dict):
+            elif default_is_dict:
                 if field.name in default:
                     field_default = default[field.name]
-            elif default not in (None, argparse.SUPPRESS):
+            elif default_is_instance:
                 field_default = getattr(default, field.name)
 
-            if utils.is_tuple_or_list_of_dataclasses(field_type):
+            field_kind = _get_field_kind(self.dataclass, field)
+            if field_kind is _FieldKind.CONTAINER_OF_DATACLASSES:
                 raise NotImplementedError(
                     f"Field {field.name} is of type {field_type}, which isn't "
                     f"supported yet. (container of a dataclass type)"
                 )
 
-            if utils.is_subparser_field(field) or utils.is_choice(field):
+            # NOTE: Same as `utils.is_subparser_field(field) or utils.is_choice(field)`.
+            if (
+                field_kind is _FieldKind.UNION_OF_DATACLASSES
+                or utils.is_choice(field)
+                or (field.metadata.get("subparsers") and not utils.is_union(field_type))
+            ):
                 field_wrapper = self.field_wrapper_class(
                     field,
                     parent=self,
@@ -132,7 +171,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
                 self.fields.append(field_wrapper)
 
-            elif dataclasses.is_dataclass(field_type) and field.default is not None:
+            elif field_kind is _FieldKind.DATACLASS and field.default is not None:
                 # Non-optional dataclass field.
                 # handle a nested dataclass attribute
                 dataclass, name = field_type, field.name
@@ -149,7 +188,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                 )
                 self._children.append(child_wrapper)
 
-            elif utils.contains_dataclass_type_arg(field_type):
+            elif field_kind in (_FieldKind.DATACLASS, _FieldKind.CONTAINS_DATACLASS):
                 # Extract the dataclass type from the annotation of the field.
                 field_dataclass = utils.get_dataclass_type_arg(field_type)
                 # todo: Figure out if this is still necessary, or if `field_default` can be handled
@@ -186,19 +225,18 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         parser = cast(ArgumentParser, parser)
 
         group = parser.add_argument_group(title=self.title, description=self.description)
+        # NOTE: The defaults are the same for all the fields, so only check them once.
+        suppress_defaults = argparse.SUPPRESS in self.defaults
 
+        # NOTE: There are no FieldWrappers for the fields with `cmd=False` (see `__init__`).
         for wrapped_field in self.fields:
-            # Note: This should be true since we don't create a FieldWrapper for fields with
-            # `cmd=False`.
-            assert wrapped_field.field.metadata.get("cmd", True)
-
             if wrapped_field.is_subparser:
                 wrapped_field.add_subparsers(parser)
                 continue
 
             arg_options = wrapped_field.arg_options
 
-            if argparse.SUPPRESS in self.defaults:
+            if suppress_defaults:
                 arg_options["default"] = argparse.SUPPRESS
             if wrapped_field.is_subgroup:
                 # NOTE: Not skipping subgroup fields, because even though they will have been
@@ -208,17 +246,17 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                     f"--help text."
                 )
 
-            logger.debug(f"group.add_argument(*{wrapped_field.option_strings}, **{arg_options})")
+            # NOTE: The option strings are recomputed on each access, so only get them once.
+            option_strings = wrapped_field.option_strings
+            logger.debug("group.add_argument(*%s, **%s)", option_strings, arg_options)
             # TODO: Perhaps we could hook into the `action` that is returned here to know if the
             # flag was passed or not for a given field.
-            _ = group.add_argument(*wrapped_field.option_strings, **arg_options)
+            _ = group.add_argument(*option_strings, **arg_options)
 
     def equivalent_argparse_code(self, leading="group") -> str:
         code = ""
-        code += textwrap.dedent(
-            f"""
-        group = parser.add_argument_group(title="{self.title.strip()}", description="{self.description.strip()}")
-        """
+        code += _ARGUMENT_GROUP_CODE_TEMPLATE.format(
+            title=self.title.strip(), description=self.description.strip()
         )
         for wrapped_field in self.fields:
             if wrapped_field.is_subparser:
@@ -241,7 +279,8 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                 """
                 )
             elif wrapped_field.arg_options:
-                code += textwrap.dedent(wrapped_field.equivalent_argparse_code()) + "\n"
+                # NOTE: The code for a field is a single line, so there is nothing to dedent.
+                code += wrapped_field.equivalent_argparse_code() + "\n"
         return code
 
     @property
@@ -316,12 +355,20 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
     @property
     def title(self) -> str:
-        names_string = f""" [{', '.join(f"'{dest}'" for dest in self.destinations)}]"""
-        title = self.dataclass.__qualname__ + names_string
-        return title
+        # NOTE: The title depends on the destinations, so it is reset when they change.
+        if self._title is None:
+            names_string = f""" [{', '.join(f"'{dest}'" for dest in self.destinations)}]"""
+            self._title = self.dataclass.__qualname__ + names_string
+        return self._title
 
     @property
     def description(self) -> str:
+        # NOTE: Finding the docstrings is slow, and they don't change, so this is only done once.
+        if self._description is None:
+            self._description = self._get_description()
+        return self._description
+
+    def _get_description(self) -> str:
         if self.parent and self._field:
             doc = docstring.get_attribute_docstring(self.parent.dataclass, self._field.name)
             if doc is not None:
@@ -373,10 +420,14 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
     @property
     def required(self) -> bool:
-        return self._required
+        return bool(self._required)
 
     @required.setter
     def required(self, value: bool):
+        if value == self._required:
+            # The value was already set on the fields and the children (e.g. when this is an
+            # optional dataclass field inside of another optional dataclass field).
+            return
         self._required = value
         for field in self.fields:
             field.required = value
@@ -388,23 +439,31 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         return len(self.destinations) > 1
 
     @property
-    def descendants(self):
-        for child in self._children:
-            yield child
-            yield from child.descendants
+    def descendants(self) -> list[DataclassWrapper]:
+        """All the wrappers below this one in the tree, in depth-first (pre-)order.
+
+        NOTE: This isn't cached, since the children can be modified from the outside (for example
+        when resolving subgroups or merging wrappers).
+        """
+        descendants: list[DataclassWrapper] = []
+        # Using an explicit stack rather than recursive generators.
+        stack = self._children[::-1]
+        while stack:
+            wrapper = stack.pop()
+            descendants.append(wrapper)
+            stack.extend(reversed(wrapper._children))
+        return descendants
 
     @property
-    def dest(self):
-        lineage = []
-        parent = self.parent
-        while parent is not None:
-            lineage.append(parent.name)
-            parent = parent.parent
-        lineage = list(reversed(lineage))
-        lineage.append(self.name)
-        _dest = ".".join(lineage)
-        # logger.debug(f"getting dest, returning {_dest}")
-        return _dest
+    def dest(self) -> str:
+        # NOTE: The name and the parent of the wrapper can't change, so the dest is only computed
+        # once (using the (also cached) dest of the parent).
+        if not self._dest:
+            if self.parent is not None:
+                self._dest = f"{self.parent.dest}.{self.name}"
+            else:
+                self._dest = self.name
+        return self._dest
 
     @property
     def destinations(self) -> list[str]:
@@ -418,6 +477,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
     @destinations.setter
     def destinations(self, value: list[str]):
         self._destinations = value
+        self._title = None
 
     def merge(self, other: DataclassWrapper):
         """Absorb all the relevant attributes from another wrapper.
@@ -430,9 +490,14 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         logger.debug(f"other destinations: {other.destinations}")
         # assert not set(self.destinations).intersection(set(other.destinations)), "shouldn't have overlap in destinations"
         # self.destinations.extend(other.destinations)
+        destinations = self.destinations
+        # NOTE: Using a set to check for the destinations that are already present.
+        seen_destinations = set(destinations)
         for dest in other.destinations:
-            if dest not in self.destinations:
-                self.destinations.append(dest)
+            if dest not in seen_destinations:
+                seen_destinations.add(dest)
+                destinations.append(dest)
+        self._title = None
         logger.debug(f"destinations after merge: {self.destinations}")
         self.defaults.extend(other.defaults)
 
@@ -445,16 +510,49 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             child.merge(other_child)
 
 
-def _get_dataclass_fields(dataclass: type[Dataclass]) -> tuple[dataclasses.Field, ...]:
-    # NOTE: `dataclasses.fields` method retrieves only `dataclasses._FIELD`
-    # NOTE: but we also want to know about `dataclasses._FIELD_INITVAR`
-    # NOTE: therefore we partly copy-paste its implementation
-    try:
-        dataclass_fields_map = getattr(dataclass, dataclasses._FIELDS)
-    except AttributeError:
-        raise TypeError("must be called with a dataclass type or instance")
-    return tuple(
-        field
-        for field in dataclass_fields_map.values()
-        if field._field_type in (dataclasses._FIELD, dataclasses._FIELD_INITVAR)
-    )
+class _FieldKind(enum.Enum):
+    """The kinds of field types that are treated differently when creating the wrappers."""
+
+    CONTAINER_OF_DATACLASSES = enum.auto()
+    """A tuple or list of dataclasses (not supported yet)."""
+    UNION_OF_DATACLASSES = enum.auto()
+    """A union of dataclass types (a subparser field)."""
+    DATACLASS = enum.auto()
+    """A dataclass type (a nested dataclass field)."""
+    CONTAINS_DATACLASS = enum.auto()
+    """Some other annotation that contains a dataclass type, e.g. `Optional[SomeDataclass]`."""
+    OTHER = enum.auto()
+
+
+# The kind of each field of a dataclass type, keyed weakly on the dataclass type so that the cache
+# doesn't keep the dataclasses (or the types in their annotations) alive.
+_field_kinds_cache: weakref.WeakKeyDictionary[type, dict[str, _FieldKind]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_field_kind(dataclass: type, field: dataclasses.Field) -> _FieldKind:
+    """Returns the kind of the type of a field of the given dataclass.
+
+    Classifying the type annotations means inspecting them with `typing.get_origin`,
+    `typing.get_args`, etc., so we only do it once per field of each dataclass type.
+    """
+    field_kinds = _field_kinds_cache.setdefault(dataclass, {})
+    field_kind = field_kinds.get(field.name)
+    if field_kind is None:
+        field_kind = field_kinds[field.name] = _get_field_kind_uncached(field.type)
+    return field_kind
+
+
+def _get_field_kind_uncached(field_type: Any) -> _FieldKind:
+    if utils.is_tuple_or_list_of_dataclasses(field_type):
+        return _FieldKind.CONTAINER_OF_DATACLASSES
+    if utils.is_union(field_type) and all(
+        map(dataclasses.is_dataclass, utils.get_type_arguments(field_type))
+    ):
+        return _FieldKind.UNION_OF_DATACLASSES
+    if dataclasses.is_dataclass(field_type):
+        return _FieldKind.DATACLASS
+    if utils.contains_dataclass_type_arg(field_type):
+        return _FieldKind.CONTAINS_DATACLASS
+    return _FieldKind.OTHER
@@ -112,6 +112,9 @@ class FieldWrapper(Wrapper):
         # (could've used cached_property with Python 3.8).
         self._option_strings: set[str] | None = None
         self._required: bool | None = None
+        # NOTE: The metadata of the field can't change, so the subgroup-related entries are only
+        # looked up once, rather than each time they are needed while resolving the subgroups.
+        self._is_subgroup: bool = "subgroups" in field.metadata
 
         try:
             self._docstring = docstring.get_attribute_docstring(
@@ -129,6 +132,7 @@ class FieldWrapper(Wrapper):
         self._arg_options: dict[str, Any] = {}
         self._dest_field: FieldWrapper | None = None
         self._type: type[Any] | None = None
+        self._literal_choice_dict: dict[str, Any] | None = None
 
         # stores the resulting values for each of the destination attributes.
         self._results: dict[str, Any] = {}
@@ -197,12 +201,18 @@ class FieldWrapper(Wrapper):
 
         self._results = {}
 
-        for destination, value in zip(self.destinations, values):
-            if self.is_subgroup:
-                logger.debug(f"Ignoring the FieldWrapper for subgroup at dest {self.dest}")
-                return
-
-            parent_dest, attribute = utils.split_dest(destination)
+        if self.is_subgroup:
+            # NOTE: The subgroup choices are resolved (and removed from the namespace) before the
+            # fields are called, so there is nothing to set here. This also means that the fields
+            # never write to the namespace while its values are being consumed.
+            logger.debug("Ignoring the FieldWrapper for subgroup at dest %s", self.dest)
+            return
+
+        # NOTE: Iterating over the destinations of the parent rather than over
+        # `self.destinations`, which would be built from them, only to be split again here.
+        attribute = self.name
+        for parent_dest, value in zip(self.parent.destinations, values):
+            destination = f"{parent_dest}.{attribute}"
             value = self.postprocess(value)
 
             self._results[destination] = value
@@ -212,21 +222,9 @@ class FieldWrapper(Wrapper):
             #     constructor_arguments[parent_dest][attribute] = value
 
             # TODO: Need to decide which one to do here. Seems easier to always set all the values.
-            logger.debug(f"constructor_arguments[{parent_dest}][{attribute}] = {value}")
+            logger.debug("constructor_arguments[%s][%s] = %s", parent_dest, attribute, value)
             constructor_arguments[parent_dest][attribute] = value
 
-            if self.is_subgroup:
-                if not hasattr(namespace, "subgroups"):
-                    namespace.subgroups = {}
-
-                if isinstance(value, str) and value in self.subgroup_choices.keys():
-                    # We've just parsed the name of the chosen subgroup.
-                    # NOTE: There can't be any ambiguity here, since the keys of the dictionary are
-                    # string, and the values are always dataclass types. We don't need to worry
-                    # about having to deal with {"bob": "alice", "alice": "foo"}-type weirdness.
-                    namespace.subgroups[self.dest] = value
-                    logger.debug(f"Chosen subgroup for '{self.dest}':  '{value}'")
-
     def get_arg_options(self) -> dict[str, Any]:
         """Create the `parser.add_arguments` kwargs for this field.
 
@@ -876,12 +874,18 @@ class FieldWrapper(Wrapper):
     def choice_dict(self) -> dict[str, Any] | None:
         if "choice_dict" in self.field.metadata:
             return self.field.metadata["choice_dict"]
+        if self._literal_choice_dict is not None:
+            return self._literal_choice_dict
         if utils.is_literal(self.type):
             literal_values = list(utils.get_args(self.type))
             assert literal_values, "Literal always has at least one argument."
             # We map from literal values (as strings) to the actual values.
             # e.g. from BLUE -> Color.Blue
-            return {(v.name if isinstance(v, Enum) else str(v)): v for v in literal_values}
+            # NOTE: This is used to postprocess each parsed value, so it is only built once.
+            self._literal_choice_dict = {
+                (v.name if isinstance(v, Enum) else str(v)): v for v in literal_values
+            }
+            return self._literal_choice_dict
         return None
 
     @property
@@ -953,7 +957,7 @@ class FieldWrapper(Wrapper):
 
     @property
     def is_subgroup(self) -> bool:
-        return "subgroups" in self.field.metadata
+        return self._is_subgroup
 
     @property
     def subgroup_choices(self) -> dict[Hashable, Callable[[], Dataclass] | Dataclass]:
@@ -967,6 +971,12 @@ class FieldWrapper(Wrapper):
             raise RuntimeError(f"Field {self.field} doesn't have subgroups! ")
         return self.field.metadata.get("subgroup_default")
 
+    @property
+    def subgroup_dataclass_types(self) -> dict[Hashable, type[Dataclass]]:
+        if not self.is_subgroup:
+            raise RuntimeError(f"Field {self.field} doesn't have subgroups! ")
+        return self.field.metadata["subgroup_dataclass_types"]
+
     @property
     def type_arguments(self) -> tuple[type, ...] | None:
         return utils.get_type_arguments(self.type)
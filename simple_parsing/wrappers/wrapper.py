@@ -7,6 +7,7 @@ from typing import List, Optional
 class Wrapper(ABC):
     def __init__(self):
         self._dest: Optional[str] = None
+        self._nesting_level: Optional[int] = None
 
     @abstractmethod
     def equivalent_argparse_code(self) -> str:
@@ -40,10 +41,9 @@ class Wrapper(ABC):
 
     @property
     def nesting_level(self) -> int:
-        return len(self.lineage())
-        level = 0
-        parent = self.parent
-        while parent is not None:
-            parent = parent.parent
-            level += 1
-        return level
+        # NOTE: The parent of a wrapper doesn't change, so the nesting level is only computed once
+        # (using the (also cached) nesting level of the parent).
+        if self._nesting_level is None:
+            parent = self.parent
+            self._nesting_level = 0 if parent is None else parent.nesting_level + 1
+        return self._nesting_level
@@ -1,5 +1,8 @@
 import argparse
+import dataclasses
+import gc
 import shlex
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Type
@@ -8,6 +11,7 @@ import pytest
 
 import simple_parsing
 from simple_parsing import ArgumentParser
+from simple_parsing.wrappers.dataclass_wrapper import _FieldKind, _get_field_kind
 
 from .testutils import TestSetup, parametrize, raises, raises_missing_required_arg
 
@@ -317,3 +321,25 @@ def test_issue62():
     #                             a list of temperatures (default: [<Temperature.COLD:
     #                             -1>, <Temperature.WARM: 0>])
     # """)
+
+
+def test_field_kinds_are_cached_without_keeping_dataclasses_alive():
+    @dataclass
+    class Child:
+        a: int = 1
+
+    @dataclass
+    class Parent:
+        child: Child = field(default_factory=Child)
+        b: str = "b"
+
+    child_field, b_field = dataclasses.fields(Parent)
+    assert _get_field_kind(Parent, child_field) is _FieldKind.DATACLASS
+    assert _get_field_kind(Parent, b_field) is _FieldKind.OTHER
+
+    child_ref = weakref.ref(Child)
+    parent_ref = weakref.ref(Parent)
+    del Child, Parent, child_field, b_field
+    gc.collect()
+    assert child_ref() is None
+    assert parent_ref() is None
@@ -208,6 +208,18 @@ def test_replace_nested_dataclasses(
             TypeError,
             "unexpected keyword argument 'foo'",
         ),
+        (
+            B(),
+            {"b_post_init": "bob"},
+            ValueError,
+            "Cannot replace value of non-init field b_post_init",
+        ),
+        (
+            OuterPostInit(),
+            {"out_arg_post": "bob", "inner.in_arg": 2.0},
+            ValueError,
+            "Cannot replace value of non-init field out_arg_post",
+        ),
         pytest.param(
             WithOptional(optional_a=None),
             {"optional_a.a": 123},
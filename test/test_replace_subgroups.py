@@ -53,3 +53,51 @@ def test_replace_subgroups():
     assert replace_subgroups(c, {"nested_subgroup": {"a_or_b": "b"}}) == Config(
         nested_subgroup=AorB(a_or_b=B())
     )
+
+
+@dataclass
+class WithList:
+    values: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ConfigWithList:
+    union: A | WithList = field(default_factory=A)
+
+
+def test_replace_subgroups_with_instance_makes_a_copy():
+    c = Config()
+    selection = B(b="bob")
+    new_config = replace_subgroups(c, {"union": selection})
+    assert new_config.union == selection
+    assert new_config.union is not selection
+
+    # Mutable attributes aren't shared with the selected instance.
+    selection_with_list = WithList(values=[1, 2, 3])
+    new_config_with_list = replace_subgroups(ConfigWithList(), {"union": selection_with_list})
+    assert new_config_with_list.union == selection_with_list
+    assert new_config_with_list.union.values is not selection_with_list.values
+
+
+class _SlotsBase:
+    __slots__ = ("values",)
+
+
+@dataclass
+class WithSlots(_SlotsBase):
+    """Has a `__dict__`, but stores the `values` attribute in a slot of its base class."""
+
+    values: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ConfigWithSlots:
+    union: A | WithSlots = field(default_factory=A)
+
+
+def test_replace_subgroups_with_slots_instance_makes_a_deep_copy():
+    selection = WithSlots(values=[1, 2, 3])
+    assert not vars(selection)
+    new_config = replace_subgroups(ConfigWithSlots(), {"union": selection})
+    assert new_config.union == selection
+    assert new_config.union.values is not selection.values
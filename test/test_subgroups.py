@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import dataclasses
 import functools
 import inspect
@@ -15,6 +16,7 @@ from pytest_regressions.file_regression import FileRegressionFixture
 from typing_extensions import Annotated
 
 from simple_parsing import ArgumentParser, parse, subgroups
+from simple_parsing.parsing import _get_default_subgroup_choices
 from simple_parsing.wrappers.field_wrapper import ArgumentGenerationMode, NestedMode
 
 from .test_choice import Color
@@ -273,6 +275,11 @@ def test_subgroup_default_factory_needs_to_be_value_in_dict():
         ValueError, match="`default_factory` must be a value in the subgroups dict"
     ):
         _ = subgroups({"a": B, "aa": A}, default_factory=C)
+    # The default_factory is checked before the values of the subgroups dict.
+    with pytest.raises(
+        ValueError, match="`default_factory` must be a value in the subgroups dict"
+    ):
+        _ = subgroups({"a": B, "aa": lambda: A()}, default_factory=C)
 
 
 def test_lambdas_dont_return_same_instance():
@@ -935,3 +942,57 @@ def test_ordering_of_args_doesnt_matter():
         model=ModelAConfig(lr=0.0003, optimizer="Adam", betas=(0.0, 1.0)),
         dataset=Dataset2Config(data_dir="data/bar", bar=1.2),
     )
+
+
+@pytest.mark.parametrize(
+    ("args", "namespace", "expected"),
+    [
+        ("", None, AB(a_or_b=A())),
+        ("--a_or_b b", None, AB(a_or_b=B())),
+        ("--a_or_b=b", None, AB(a_or_b=B())),
+        ("--a 1.5", None, AB(a_or_b=A(a=1.5))),
+        ("", argparse.Namespace(**{"ab.a_or_b": "b"}), AB(a_or_b=B())),
+        ("--a_or_b a", argparse.Namespace(**{"ab.a_or_b": "b"}), AB(a_or_b=A())),
+    ],
+)
+def test_subgroup_choice_without_reparsing(
+    args: str, namespace: argparse.Namespace | None, expected: AB
+):
+    """Test the choice of subgroup when `args` may not contain the subgroup argument, in which
+    case the default choice is used without parsing the args again."""
+    parser = ArgumentParser()
+    parser.add_arguments(AB, dest="ab")
+    parsed_args = parser.parse_args(shlex.split(args), namespace=namespace)
+    assert parsed_args.ab == expected
+
+
+@pytest.mark.parametrize(
+    ("args", "namespace", "argument_options", "expected"),
+    [
+        # The subgroup argument is in `args`, so the args need to be parsed.
+        (["--a_or_b", "b"], None, {}, None),
+        (["--a_or_b=b"], None, {}, None),
+        # The default value is used when the subgroup argument isn't in `args`.
+        (["--a", "1.5"], None, {}, {"ab.a_or_b": "a"}),
+        # The values already in the namespace take precedence over the defaults.
+        ([], argparse.Namespace(**{"ab.a_or_b": "b"}), {}, {"ab.a_or_b": "b"}),
+        # argparse would convert the default value with the `type` function.
+        ([], None, {"type": int, "default": "1"}, None),
+        ([], None, {"type": int, "default": 1}, {"ab.a_or_b": 1}),
+        ([], None, {"required": True}, None),
+        ([], None, {"default": argparse.SUPPRESS}, None),
+    ],
+)
+def test_get_default_subgroup_choices(
+    args: list[str],
+    namespace: argparse.Namespace | None,
+    argument_options: dict,
+    expected: dict | None,
+):
+    options = {"dest": "ab.a_or_b", "default": "a", "type": str, "required": False}
+    options.update(argument_options)
+    result = _get_default_subgroup_choices([(["--a_or_b"], options)], args, namespace)
+    if expected is None:
+        assert result is None
+    else:
+        assert vars(result) == expected
@@ -1,7 +1,10 @@
+import dataclasses
 import enum
+import gc
 import os
 import sys
-from dataclasses import dataclass
+import weakref
+from dataclasses import InitVar, dataclass
 from typing import Dict, List, Set, Tuple, Type
 
 import simple_parsing.utils as utils
@@ -184,3 +187,21 @@ def test_unflatten():
     a = {"b": 2, "c": 3}
     d = {"a": a, "d": {"e": a}}
     assert unflatten_split(flatten_join(d)) == d
+
+
+def test_get_dataclass_fields():
+    """Test that the fields are cached without keeping the dataclass types alive."""
+
+    @dataclass
+    class Foo:
+        a: int = 1
+        b: InitVar[int] = 2
+
+    assert utils.get_dataclass_fields(Foo) == dataclasses.fields(Foo)
+    assert utils.get_dataclass_fields(Foo) is utils.get_dataclass_fields(Foo)
+    assert [f.name for f in utils.get_dataclass_fields(Foo, include_initvars=True)] == ["a", "b"]
+
+    foo_ref = weakref.ref(Foo)
+    del Foo
+    gc.collect()
+    assert foo_ref() is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib.util
 import os
 import shlex
@@ -90,6 +91,21 @@ def assert_help_output_equals(actual: str, expected: str) -> None:
     assert actual_str == expected_str, "\n" + "\n".join([actual_str, expected_str])
 
 
+@functools.lru_cache(maxsize=None)
+def _split_arguments(arguments: str) -> tuple[str, ...]:
+    """Splits the arguments string like a shell would.
+
+    `shlex.split` is fairly slow, and the same argument strings are used many times in the tests
+    (e.g. in parametrized tests), so the results are cached.
+    """
+    return tuple(shlex.split(arguments))
+
+
+def split_arguments(arguments: str) -> list[str]:
+    """Returns a (new) list of the arguments in `arguments`, split like a shell would."""
+    return list(_split_arguments(arguments))
+
+
 T = TypeVar("T")
 
 
@@ -113,7 +129,7 @@ class TestParser(simple_parsing.ArgumentParser, Generic[T]):
         return super().add_arguments(dataclass, dest, prefix=prefix, default=default)
 
     def __call__(self, args: str) -> T:
-        namespace = self.parse_args(shlex.split(args))
+        namespace = self.parse_args(split_arguments(args))
         value = getattr(namespace, self._current_dest)
         value = cast(T, value)
         return value
@@ -193,7 +209,7 @@ class TestSetup:
                 else:
                     args = parser.parse_args()
             else:
-                splits = shlex.split(arguments)
+                splits = split_arguments(arguments)
                 if parse_known_args:
                     args, unknown_args = parser.parse_known_args(
                         splits, attempt_to_reorder=attempt_to_reorder
@@ -230,7 +246,7 @@ class TestSetup:
         if arguments is None:
             args = parser.parse_args()
         else:
-            splits = shlex.split(arguments)
+            splits = split_arguments(arguments)
             args = parser.parse_args(splits)
 
         return tuple(getattr(args, f"{class_name}_{i}") for i in range(num_to_parse))